@@ -1,6 +1,9 @@
 import asyncio
 import os
+import platform
 import subprocess
+import sys
+import threading
 import time
 from typing import Any, Coroutine, TypeVar, NamedTuple
 
@@ -30,7 +33,7 @@ from utils.manual.scrape_legal_websites_utils.fetch_robots_txt import fetch_robo
 from utils.manual.scrape_legal_websites_utils.parse_robots_txt import parse_robots_txt 
 from utils.manual.scrape_legal_websites_utils.extract_urls_using_javascript import extract_urls_using_javascript
 from utils.manual.scrape_legal_websites_utils.can_fetch import can_fetch
-from utils.shared.decorators.try_except import try_except
+from utils.shared.decorators.try_except import try_except, async_try_except
 
 from config.config import LEGAL_WEBSITE_DICT, OUTPUT_FOLDER
 
@@ -51,74 +54,313 @@ AbstractInstance = TypeVar('AbstractInstance')
 
 from urllib.robotparser import RobotFileParser
 from urllib.error import URLError
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse, urlunparse, quote, unquote
 
 from .AbstractBrowserController import AsyncAbstractBrowserController, SyncAbstractBrowserController
 
 from playwright.async_api import (
     async_playwright,
     Playwright as AsyncPlaywright,
+    BrowserContext as AsyncPlaywrightBrowserContext,
+    Locator as AsyncPlaywrightLocator,
     Page as AsyncPlaywrightPage,
+    Route as AsyncPlaywrightRoute,
     Browser as AsyncPlaywrightBrowser,
     Error as PlaywrightError,
     TimeoutError as PlaywrightTimeoutError,
 )
 
-class PlaywrightScrapper:
+
+# Parsed robots.txt rules shared by every scraper in the process, keyed by domain.
+# Values are (parser, time fetched).
+_ROBOTS_CACHE: dict[str, tuple[RobotFileParser, float]] = {}
+_ROBOTS_CACHE_LOCK = threading.Lock()
+_ROBOTS_CACHE_TTL = 24 * 60 * 60 # 24 hours, in seconds.
+
+class _RobotsRuleTrie:
+    """
+    Character trie over the Allow/Disallow paths of a single robots.txt entry.
+    Gives the same answer as RobotFileParser.can_fetch, where the first matching rule wins,
+    but in time proportional to the length of the URL path rather than the number of rules.
+    """
+    def __init__(self, rulelines: list) -> None:
+        self._root: dict = {}
+        self._wildcard: tuple[int, bool] = None
+        for idx, rule in enumerate(rulelines):
+            if rule.path == "*":
+                self._wildcard = self._wildcard or (idx, rule.allowance)
+                continue
+            node = self._root
+            for char in rule.path:
+                node = node.setdefault(char, {})
+            # The None key marks the end of a rule. Only the first rule for a path can ever match.
+            node.setdefault(None, (idx, rule.allowance))
+
+    def allowed(self, path: str) -> bool:
+        best = self._wildcard
+        node = self._root
+        for char in (None, *path):
+            if char is not None:
+                node = node.get(char)
+                if node is None:
+                    break
+            rule = node.get(None)
+            if rule is not None and (best is None or rule[0] < best[0]):
+                best = rule
+        return True if best is None else best[1]
+
+
+def _build_robots_trie(rp: RobotFileParser, user_agent: str) -> _RobotsRuleTrie|None:
+    """
+    Build a rule trie for the robots.txt entry that applies to a user agent.
+    Returns None when RobotFileParser.can_fetch answers without checking any rules.
+    """
+    if rp.disallow_all or rp.allow_all or not rp.mtime():
+        return None
+    for entry in rp.entries:
+        if entry.applies_to(user_agent):
+            return _RobotsRuleTrie(entry.rulelines)
+    return _RobotsRuleTrie(rp.default_entry.rulelines if rp.default_entry else [])
+
+
+def _robots_path(url: str) -> str:
+    """
+    Normalize a URL to the path RobotFileParser.can_fetch matches rules against.
+    """
+    parsed_url = urlparse(unquote(url))
+    path = quote(urlunparse(('', '', parsed_url.path, parsed_url.params, parsed_url.query, parsed_url.fragment)))
+    return path or "/"
+
+
+# Image types take_screenshot can save without coercing the filename.
+_SCREENSHOT_EXT = ('.png', '.jpg', '.jpeg')
+
+# Resource types that can be blocked when only the page's HTML or text is needed.
+TEXT_ONLY_BLOCK_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Opening images after saving them relies on explorer.exe, so it only works in WSL.
+_IS_WSL = sys.platform.startswith('linux') and 'microsoft' in platform.uname().release.lower()
+
+
+class _CrawlDelayMixin:
+    """
+    Spaces out a scraper's requests to its host by the robots.txt crawl delay.
+    Classes using it set crawl_delay, _crawl_delay_lock, and _next_request_time in __init__.
+    """
+    crawl_delay: float
+    _crawl_delay_lock: asyncio.Lock
+    _next_request_time: float
+
+    async def _wait_for_crawl_delay(self, delay: float=None) -> None:
+        """
+        Wait until the crawl delay has passed since the last request to the host.
+        The delay is shared by every task on this scraper, so concurrent requests
+        are spaced out by it instead of each one sleeping for the full delay.
+
+        Args:
+            delay (float, optional): The delay to use, in seconds. Defaults to crawl_delay.
+        """
+        if delay is None:
+            delay = self.crawl_delay
+        async with self._crawl_delay_lock:
+            wait = self._next_request_time - time.monotonic()
+            if wait > 0:
+                logger.debug(f"Sleeping for {wait:.2f} seconds to respect robots.txt crawl delay")
+                await asyncio.sleep(wait)
+            self._next_request_time = time.monotonic() + (delay or 0)
+        return
+
+
+class PlaywrightScrapper(_CrawlDelayMixin):
 
     def __init__(self, 
                  domain: str,
                  user_agent: str="*", 
+                 max_parallel: int=3,
+                 pages_per_context: int=20,
+                 context_kwargs: dict=None,
+                 persistent_context: bool=False,
+                 user_data_dir: str=None,
+                 nav_timeout_ms: int=15_000,
+                 idle_timeout_ms: int=8_000,
+                 block_types: set[str]=None,
                  **launch_kwargs):
         self.launch_kwargs = launch_kwargs
         self.domain: str = domain
         self.user_agent: str = user_agent
         self.rp: RobotFileParser = RobotFileParser()
         self.browser: AsyncPlaywrightBrowser = None
-        self.crawl_delay: int = None
+        self.crawl_delay: float = None
         self.rrate: NamedTuple = None
         self.page: AsyncPlaywrightPage = None
+        self._robots_trie: _RobotsRuleTrie = None
+
+        # The domain never changes, so sanitize it and make the screenshot directory once.
+        self._sanitized_domain: str = sanitize_filename(self.domain)
+        self._screenshot_dir: str = os.path.join(OUTPUT_FOLDER, self._sanitized_domain)
+        os.makedirs(self._screenshot_dir, exist_ok=True)
+
+        # Explicit timeouts, so a dead page can't stall a batch for Playwright's 30 second default.
+        self.nav_timeout_ms: int = nav_timeout_ms
+        self.idle_timeout_ms: int = idle_timeout_ms
+
+        # Pool of pages shared by navigate_to_many. Filled in start.
+        self.max_parallel: int = max_parallel
+        self._page_pool: asyncio.Queue[AsyncPlaywrightPage] = None
+        # The pool's pages get their own context, so recycling it doesn't close self.page, and vice versa.
+        self._pool_context: AsyncPlaywrightBrowserContext = None
+        self._pool_navs: int = 0
+
+        # Host-wide crawl delay, shared across all concurrent navigations.
+        self._crawl_delay_lock: asyncio.Lock = asyncio.Lock()
+        self._next_request_time: float = 0.0
+
+        # Pages are opened in a shared context that is replaced every pages_per_context pages.
+        self.pages_per_context: int = pages_per_context
+        self._ctx_kwargs: dict = context_kwargs or {}
+        self._context: AsyncPlaywrightBrowserContext = None
+        self._pages_since_recycle: int = 0
+
+        # Resource types to abort at the context level, e.g. TEXT_ONLY_BLOCK_TYPES.
+        # NOTE The route lives on the context, so context recycling also stops it from leaking.
+        self.block_types: frozenset[str] = frozenset(block_types or ())
+
+        # Reuse the on-disk cache, cookies, and service workers across runs.
+        # Defaults to a per-domain profile directory in the output folder.
+        self.persistent_context: bool = persistent_context or user_data_dir is not None
+        self.user_data_dir: str = user_data_dir
+        if self.persistent_context and self.user_data_dir is None:
+            self.user_data_dir = os.path.join(OUTPUT_FOLDER, ".pw_profiles", self._sanitized_domain)
 
 
     # Define class enter and exit methods.
-    @try_except(exception=[URLError], retries=2, raise_exception=True)
-    def _get_robot_rules(self):
+    @async_try_except(exception=[aiohttp.ClientError, asyncio.TimeoutError], retries=2, raise_exception=True)
+    async def _get_robot_rules(self):
         """
         Get the site's robots.txt file and assign it to the class' applicable attributes
+        The parsed rules are cached for the whole process, so each domain is only fetched once per TTL.
         See: https://docs.python.org/3/library/urllib.robotparser.html
         """
+        # Use the cached rules if another scraper already got them.
+        with _ROBOTS_CACHE_LOCK:
+            cached = _ROBOTS_CACHE.get(self.domain)
+        if cached and time.time() - cached[1] < _ROBOTS_CACHE_TTL:
+            logger.debug(f"Using cached robots.txt rules for '{self.domain}'")
+            self.rp = cached[0]
+            self._apply_robot_rules()
+            return
+
         # Construct the URL to the robots.txt file
         robots_url = urljoin(self.domain, 'robots.txt')
         self.rp.set_url(robots_url)
 
-        # Read the robots.txt file from the server
-        self.rp.read()
+        # Read the robots.txt file from the server.
+        # NOTE This mirrors RobotFileParser.read, but without blocking the event loop.
+        # Server errors leave the parser unread, so can_fetch disallows everything, per RFC 9309.
+        # They're likely to be temporary, so they aren't cached.
+        async with aiohttp.ClientSession() as session:
+            async with session.get(robots_url, timeout=5) as response:
+                cacheable = response.status < 500
+                if response.status in (401, 403):
+                    self.rp.disallow_all = True
+                elif 400 <= response.status < 500:
+                    self.rp.allow_all = True
+                elif response.status < 400:
+                    content = await response.text()
+                    self.rp.parse(content.splitlines())
+
+        self._apply_robot_rules()
+
+        if not cacheable:
+            logger.warning(f"Got HTTP {response.status} for '{robots_url}'. Disallowing all URLs until it can be read.")
+            return
+        with _ROBOTS_CACHE_LOCK:
+            _ROBOTS_CACHE[self.domain] = (self.rp, time.time())
+        return
+
 
+    def _apply_robot_rules(self) -> None:
+        """
+        Set the request rate, crawl delay, and rule trie for our user agent from the parsed robots.txt.
+        These depend on the user agent, so they're worked out per scraper rather than cached with the parser.
+        """
         # Set the request rate.
         self.rrate = self.rp.request_rate(self.user_agent)
 
-        # Set the crawl delay
-        self.crawl_delay = int(self.rp.crawl_delay(self.user_agent))
-        return
+        # Set the crawl delay. robots.txt files without a Crawl-delay directive return None.
+        self.crawl_delay = float(self.rp.crawl_delay(self.user_agent) or 0)
+
+        # Compile the rules for our user agent so URL checks don't scan every rule.
+        self._robots_trie = _build_robots_trie(self.rp, self.user_agent)
 
 
     async def _load_browser(self, pw_instance: AsyncPlaywright):
         """
-        Launch a chromium instance and load a page
+        Launch a chromium instance and load a page.
+        If a persistent context is used, the browser is launched with the on-disk user data directory instead.
+        """
+        if self.persistent_context:
+            os.makedirs(self.user_data_dir, exist_ok=True)
+            self._context = await pw_instance.chromium.launch_persistent_context(self.user_data_dir, **self.launch_kwargs)
+            # NOTE Playwright returns None for the browser of a persistent context.
+            self.browser = self._context.browser
+            await self._block_resources(self._context)
+        else:
+            self.browser = await pw_instance.chromium.launch(**self.launch_kwargs)
+        return self.browser
+
+
+    async def _fill_page_pool(self) -> None:
+        """
+        Open max_parallel pages for navigate_to_many to share, replacing any already in the pool.
+        The pages share one context, so block_types applies to them, and it's replaced each time the pool is refilled.
+        A persistent context is never replaced, so only the pool's pages are.
         """
-        self._browser = await pw_instance.chromium.launch(**self.launch_kwargs)
+        if self.persistent_context:
+            if self._page_pool:
+                while not self._page_pool.empty():
+                    await self._page_pool.get_nowait().close()
+            context = self._context
+        else:
+            # Closing the old context also closes the old pool's pages.
+            self._pool_context = context = await self._replace_context(self._pool_context)
+
+        self._page_pool = asyncio.Queue(maxsize=self.max_parallel)
+        for _ in range(self.max_parallel):
+            page = await context.new_page()
+            page.set_default_timeout(self.nav_timeout_ms)
+            self._page_pool.put_nowait(page)
+        self._pool_navs = 0
+        return
 
 
     @try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
     # Define the context manager methods
     @classmethod
-    async def start(cls, pw_instance: AsyncPlaywright) -> 'PlaywrightScrapper':
-        instance = cls()
-        instance._get_robot_rules()
-        instance.browser = await instance._load_browser(pw_instance)
+    async def start(cls, domain: str, pw_instance: AsyncPlaywright, *args, **kwargs) -> 'PlaywrightScrapper':
+        instance = cls(domain, *args, **kwargs)
+        await instance._open(pw_instance)
         return instance
 
 
+    async def _open(self, pw_instance: AsyncPlaywright) -> None:
+        """
+        Get the robots.txt rules, launch the browser, and fill the page pool. Used by both start and __aenter__.
+        If any step fails, whatever was opened is closed before the error is re-raised.
+        """
+        # Fetch robots.txt while the browser launches.
+        results = await asyncio.gather(self._get_robot_rules(), self._load_browser(pw_instance), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        try:
+            if errors:
+                raise errors[0]
+            await self._fill_page_pool()
+        except BaseException:
+            await self.exit()
+            raise
+        return
+
+
     @try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
     async def exit(self) -> None:
         """
@@ -126,14 +368,22 @@ class PlaywrightScrapper:
         """
         if self.page:
             await self.page.close()
+        if self._page_pool:
+            while not self._page_pool.empty():
+                await self._page_pool.get_nowait().close()
+        if self._pool_context:
+            await self._pool_context.close()
+            self._pool_context = None
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self.browser:
             await self.browser.close()
         return
 
 
     async def __aenter__(self, pw_instance):
-        self._get_robot_rules()
-        self.browser = await self._load_browser(pw_instance)
+        await self._open(pw_instance)
         return self
 
 
@@ -141,18 +391,80 @@ class PlaywrightScrapper:
         return await self.exit()
 
 
-    async def open_new_page(self):
+    async def _replace_context(self, context: AsyncPlaywrightBrowserContext=None) -> AsyncPlaywrightBrowserContext:
+        """
+        Close a browser context, if given, and open a fresh one with resource blocking, carrying over its storage state.
+        """
+        ctx_kwargs = dict(self._ctx_kwargs)
+        if context:
+            # Keep cookies and local storage so recycling is transparent to callers.
+            ctx_kwargs["storage_state"] = await context.storage_state()
+            await context.close()
+            logger.debug("Browser context recycled.")
+        context = await self.browser.new_context(**ctx_kwargs)
+        await self._block_resources(context)
+        return context
+
+
+    async def _recycle_context(self) -> None:
+        """
+        Close the current browser context and open a fresh one, carrying over its storage state.
+        """
+        self._context = await self._replace_context(self._context)
+        self._pages_since_recycle = 0
+        return
+
+
+    async def _block_resources(self, context: AsyncPlaywrightBrowserContext) -> None:
+        """
+        Abort requests for the resource types in block_types for every page in a context.
+        """
+        if not self.block_types:
+            return
+
+        async def _handle(route: AsyncPlaywrightRoute) -> None:
+            if route.request.resource_type in self.block_types:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _handle)
+        return
+
+
+    async def open_new_page(self) -> AsyncPlaywrightPage:
         """
         Create a new brower page instance.
+        Playwright only frees a page's resources when its context is closed,
+        so the context is replaced every pages_per_context pages.
+        A persistent context is never replaced, so callers should close its pages when done with them.
         """
-        return await self.browser.new_page()
+        if not self.persistent_context:
+            if self._context is None or self._pages_since_recycle >= self.pages_per_context:
+                await self._recycle_context()
+            self._pages_since_recycle += 1
+        page = await self._context.new_page()
+        page.set_default_timeout(self.nav_timeout_ms)
+        return page
 
 
-    def _can_fetch(self, url: str) -> tuple[bool, int]:
+    def _can_fetch(self, url: str) -> tuple[bool, float]:
         """
         Check if a given URL can be fetched based on the rules in the robots.txt file.
         """
-        return True if self.rp.can_fetch(self.user_agent, url) else False
+        if self._robots_trie is None:
+            return True if self.rp.can_fetch(self.user_agent, url) else False
+        return self._robots_trie.allowed(_robots_path(url))
+
+
+    def can_fetch_many(self, urls: list[str]) -> list[bool]:
+        """
+        Check a list of URLs against the robots.txt rules in one pass.
+
+        Returns:
+            list[bool]: Whether each URL can be fetched, in the same order as urls.
+        """
+        return [self._can_fetch(url) for url in urls]
 
 
     async def navigate_to(self, url: str, **kwargs) -> Coroutine:
@@ -160,36 +472,154 @@ class PlaywrightScrapper:
         Open a specified webpage and wait for any dynamic elements to load.
         """
         # See if we're allowed to get the URL, as well as get the specified delay from robots.txt
-        if not self._can_fetch(self.user_agent, url):
+        if not self._can_fetch(url):
             logger.warning(f"Cannot scrape URL '{url}' as it's disallowed in robots.txt")
             return
 
         # Wait per the robots.txt crawl delay.
-        if self.crawl_delay > 0:
-            logger.info(f"Sleeping for {self.crawl_delay} seconds to respect robots.txt crawl delay")
-            await asyncio.sleep(self.crawl_delay)
+        await self._wait_for_crawl_delay()
+        kwargs.setdefault("timeout", self.nav_timeout_ms)
+        kwargs.setdefault("wait_until", "domcontentloaded")
         return await self.page.goto(url, **kwargs)
 
-    @try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
-    async def wait_till_idle(self) -> Coroutine[Any, Any, None]:
+
+    async def _navigate_pooled_page(self, url: str, **kwargs) -> Any:
+        """
+        Borrow a page from the pool, navigate it to a URL, then return it to the pool.
+        """
+        page = await self._page_pool.get()
+        try:
+            await self._wait_for_crawl_delay()
+            return await page.goto(url, **kwargs)
+        finally:
+            self._page_pool.put_nowait(page)
+
+
+    async def navigate_to_many(self, urls: list[str], timeout: int=None, **kwargs) -> list[Any]:
+        """
+        Navigate to several URLs concurrently using the page pool.
+        At most max_parallel pages are loading at once, and requests to the host
+        are still spaced out by the robots.txt crawl delay.
+        The pool's context is replaced every pages_per_context navigations, between batches, to free its memory.
+
+        Args:
+            urls (list[str]): The URLs to navigate to.
+            timeout (int, optional): Navigation timeout per URL, in milliseconds. Defaults to nav_timeout_ms.
+            **kwargs: Additional keyword arguments to pass to the page.goto() method.
+
+        Returns:
+            list[Any]: The response or raised exception for each URL, in the same order as urls.
+                Disallowed URLs are returned as None.
+        """
+        if self._page_pool is None:
+            raise AttributeError("'_page_pool' attribute is missing or not initialized. Use the start method or __aenter__.")
+
+        timeout = timeout or self.nav_timeout_ms
+        kwargs.setdefault("wait_until", "domcontentloaded")
+
+        # Filter out disallowed URLs before spawning any tasks.
+        allowed = self.can_fetch_many(urls)
+
+        allowed_urls = [url for url, ok in zip(urls, allowed) if ok]
+        results = []
+        start = 0
+        while start < len(allowed_urls):
+            # Recycle the pool once its context has served pages_per_context navigations.
+            if not self.persistent_context and self._pool_navs >= self.pages_per_context:
+                await self._fill_page_pool()
+            end = len(allowed_urls) if self.persistent_context else start + self.pages_per_context - self._pool_navs
+            batch = allowed_urls[start:end]
+            self._pool_navs += len(batch)
+            results += await asyncio.gather(
+                *[self._navigate_pooled_page(url, timeout=timeout, **kwargs) for url in batch],
+                return_exceptions=True
+            )
+            start = end
+        responses = iter(results)
+
+        # Log the skipped URLs as one line per batch, rather than once per URL.
+        if skipped := allowed.count(False):
+            logger.warning(f"Skipped {skipped} of {len(urls)} URLs: disallowed by robots.txt.")
+        return [next(responses) if ok else None for ok in allowed]
+
+    # Playwright load states for each wait_ready level, and their default timeouts in milliseconds.
+    _READY_LEVELS = {"dom": "domcontentloaded", "load": "load", "idle": "networkidle"}
+    _READY_TIMEOUTS_MS = {"dom": 3_000, "load": 8_000}
+
+    async def wait_ready(self, level: str="dom", timeout: int=None) -> Coroutine[Any, Any, None]:
+        """
+        Wait for a page to reach a given load level.
+        'dom' usually fires in well under a second, while 'idle' needs 500ms with no network traffic,
+        which tracker-heavy sites may never reach. Only escalate to 'idle' when it's actually needed.
+        If the page doesn't reach the level before the timeout, carry on with whatever content has loaded.
+
+        Args:
+            level (str, optional): 'dom' (DOMContentLoaded), 'load' (load event), or 'idle' (network idle). Defaults to 'dom'.
+            timeout (int, optional): Maximum time to wait, in milliseconds. 
+                Defaults to 3s for 'dom', 8s for 'load', and idle_timeout_ms for 'idle'.
+
+        Raises:
+            ValueError: If level is not one of 'dom', 'load', or 'idle'.
+        """
+        if level not in self._READY_LEVELS:
+            raise ValueError(f"level must be one of {list(self._READY_LEVELS)}, not '{level}'")
+        timeout = timeout or self._READY_TIMEOUTS_MS.get(level, self.idle_timeout_ms)
+        try:
+            return await self.page.wait_for_load_state(self._READY_LEVELS[level], timeout=timeout)
+        except PlaywrightTimeoutError:
+            logger.warning(f"Page '{self.page.url}' did not reach '{level}' before the timeout. Continuing with partial content...")
+            return
+
+    async def wait_till_idle(self, timeout: int=None) -> Coroutine[Any, Any, None]:
         """
         Wait for a page to fully finish loading.
+        Kept for compatibility. Equivalent to wait_ready('idle').
         """
-        return await self.page.wait_for_load_state("networkidle")
+        return await self.wait_ready("idle", timeout=timeout)
 
-    @try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
+    def _loc(self, selector: str, *args, **kwargs) -> AsyncPlaywrightLocator:
+        """
+        Get a Locator for a selector on the current page, reusing a cached one if possible.
+        The cache lives on the page and is cleared whenever its main frame navigates.
+        """
+        cache: dict = getattr(self.page, "_locator_cache", None)
+        if cache is None:
+            cache = self.page._locator_cache = {}
+            self.page.on("framenavigated", lambda frame: frame.parent_frame is None and cache.clear())
+
+        try:
+            key = (selector, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError: # Unhashable locator kwargs can't be cached.
+            return self.page.locator(selector, *args, **kwargs)
+
+        loc = cache.get(key)
+        if loc is None:
+            loc = cache[key] = self.page.locator(selector, *args, **kwargs)
+        return loc
+
+
+    # NOTE These are called in tight loops, so they aren't wrapped in try_except.
+    # Errors are raised straight to the orchestrating caller.
     async def move_mouse_cursor_to_element(self, selector: str, *args, **kwargs) -> Coroutine[Any, Any, None]:
         """
         Move a "mouse" cursor over a specified element.
+
+        Raises:
+            PlaywrightTimeoutError: If the element cannot be found within the default timeout.
+            PlaywrightError: Any unknown Playwright error occurs.
         """
-        await self.page.locator(selector, *args, **kwargs).hover()
+        await self._loc(selector, *args, **kwargs).hover()
 
-    @try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
     async def click_on(self, selector: str, *args, **kwargs) -> Coroutine[Any, Any, None]:
         """
         Click on a specified element.
+
+        Raises:
+            PlaywrightTimeoutError: If the element cannot be found within the default timeout.
+            PlaywrightError: Any unknown Playwright error occurs.
         """
-        return await self.page.locator(selector, *args, **kwargs).click()
+        return await self._loc(selector, *args, **kwargs).click()
 
     @try_except(exception=[PlaywrightTimeoutError, PlaywrightError])
     async def take_screenshot(self,
@@ -223,31 +653,79 @@ class PlaywrightScrapper:
             PlaywrightError: Any unknown Playwright error occurs.
         """
         # Coerce the filename to jpg if it's an unsupported image type.
-        if not filename.endswith('.png'|'.jpg'|'.jpeg'):
+        if not filename.lower().endswith(_SCREENSHOT_EXT):
             filename = f"{os.path.splitext(filename)[0]}.jpg"
             logger.warning(f"'take_screenshot' method was given an invalid picture type. Filename is now '{filename}'")
 
-        filepath = os.path.join(OUTPUT_FOLDER, sanitize_filename(self.domain), )
-        # Create the output folder if it doesn't exist.
-        if not os.path.exists(filepath):
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        filepath = os.path.join(filepath, filename)
+        filepath = os.path.join(self._screenshot_dir, filename)
 
         # Take the screenshot.
         if element:
-            await self.page.locator(element, **locator_kwargs).screenshot(path=filepath, full_page=full_page, **kwargs)
+            await self._loc(element, **(locator_kwargs or {})).screenshot(path=filepath, full_page=full_page, **kwargs)
         else:
             await self.page.screenshot(path=filepath, full_page=full_page, **kwargs)
 
-        # Open the image after it's saved.
-        if not open_image_after_save: # Normal usage: explorer.exe image.png NOTE This will only work for WSL.
-            subprocess.call(["mnt/c/Windows/explorer.exe", filepath], shell=True)
+        # Open the image after it's saved, without waiting for the viewer.
+        if open_image_after_save and _IS_WSL: # Normal usage: explorer.exe image.png NOTE This will only work for WSL.
+            subprocess.Popen(["/mnt/c/Windows/explorer.exe", filepath], close_fds=True)
         return
 
+    # Read every element's box up front, in document coordinates, so no screenshot has to scroll to find it.
+    _ELEMENT_RECTS_JS = """
+    selectors => selectors.map(sel => {
+        const el = document.querySelector(sel);
+        if (!el) return null;
+        const r = el.getBoundingClientRect();
+        return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height};
+    })
+    """
+
+    @async_try_except(exception=[PlaywrightTimeoutError, PlaywrightError])
+    async def take_screenshots(self,
+                               selectors: list[str],
+                               filenames: list[str]=None,
+                               **kwargs) -> list[str|None]:
+        """
+        Take a screenshot of each element matching a list of CSS selectors.
+        All the bounding boxes are resolved with a single evaluate call before any screenshot is taken,
+        then each element is clipped out of the page.
+
+        Args:
+            selectors (list[str]): CSS selectors of the elements to capture. The first match of each is used.
+            filenames (list[str], optional): Filenames for each screenshot. Defaults to 'element_<index>.jpg'.
+            **kwargs: Additional keyword arguments to pass to the screenshot method.
+
+        Returns:
+            list[str|None]: The filepath of each screenshot, or None if its selector matched nothing.
+
+        Raises:
+            ValueError: If selectors and filenames aren't the same length.
+            PlaywrightError: Any unknown Playwright error occurs.
+        """
+        filenames = filenames or [f"element_{idx}.jpg" for idx in range(len(selectors))]
+        if len(filenames) != len(selectors):
+            raise ValueError("selectors and filenames must be the same length.")
+
+        rects = await self.page.evaluate(self._ELEMENT_RECTS_JS, selectors)
+
+        filepaths = []
+        for selector, filename, rect in zip(selectors, filenames, rects):
+            if not rect or not rect["width"] or not rect["height"]:
+                logger.warning(f"No visible element found for selector '{selector}'. Skipping screenshot...")
+                filepaths.append(None)
+                continue
+            filepath = os.path.join(self._screenshot_dir, filename)
+            await self.page.screenshot(path=filepath, clip=rect, full_page=True, **kwargs)
+            filepaths.append(filepath)
+        return filepaths
+
+
     @try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
-    async def evaluate_js(self, javascript: str, **js_args) -> Coroutine[Any]:
+    async def evaluate_js(self, javascript: str, eval_arg: Any=None, **js_args) -> Coroutine[Any]:
         """
         Evaluate a JavaScript code in the context of a page.
+        Prefer eval_arg for values that change between calls: Playwright serializes it
+        and passes it to the script, so the script source itself stays the same.
         Example:
         >>> javascript = '''
         >>>     () => {
@@ -265,21 +743,92 @@ class PlaywrightScrapper:
         >>> search_results = await evaluate_js(javascript)
         >>> for result in search_results:
         >>>     logger.debug(f"Link: {result['href']}, Text: {result['text']}")
+        >>> # Passing a value to the script instead of formatting it in.
+        >>> count = await evaluate_js("sel => document.querySelectorAll(sel).length", eval_arg="a.result-link")
+        """
+        return await self.page.evaluate(safe_format(javascript, **js_args), eval_arg)
+
+
+    # Bucket every element matching any of the selectors in a single DOM traversal.
+    _EXTRACT_MANY_JS = """
+    ([selectorMap, attribute]) => {
+        const entries = Object.entries(selectorMap);
+        const out = Object.fromEntries(entries.map(([key]) => [key, []]));
+        const all = document.querySelectorAll(entries.map(([, sel]) => sel).join(','));
+        for (const el of all) {
+            const value = attribute ? el.getAttribute(attribute) : el.textContent.trim();
+            for (const [key, sel] of entries) {
+                if (el.matches(sel)) out[key].push(value);
+            }
+        }
+        return out;
+    }
+    """
+
+    @async_try_except(exception=[PlaywrightTimeoutError, PlaywrightError], raise_exception=True)
+    async def extract_many(self, selector_map: dict[str, str], attribute: str=None) -> dict[str, list]:
         """
-        return await self.page.evaluate(safe_format(javascript, **js_args))
+        Extract values for several CSS selectors with one round-trip to the page.
+        The selectors are joined into one querySelectorAll call, and each element is
+        bucketed under every key whose selector it matches.
 
+        Example:
+        >>> selector_map = {"links": "a.result-link", "titles": "h2.result-title"}
+        >>> results = await extract_many(selector_map)
+        >>> for title in results["titles"]:
+        >>>     logger.debug(f"Title: {title}")
 
+        Args:
+            selector_map (dict[str, str]): Mapping of result keys to CSS selectors.
+            attribute (str, optional): Attribute to extract from each element. 
+                If None, the element's trimmed text content is extracted. Defaults to None.
 
+        Returns:
+            dict[str, list]: Mapping of result keys to the extracted values, in document order.
+        """
+        if not selector_map:
+            return {}
+        return await self.page.evaluate(self._EXTRACT_MANY_JS, [selector_map, attribute])
+
+
+    # Resolve every {selector, attr} pair in a single evaluate call.
+    _BULK_EXTRACT_JS = """
+    spec => spec.map(({selector, attr}) => {
+        const el = document.querySelector(selector);
+        if (!el) return null;
+        return attr === 'text' ? el.textContent : el.getAttribute(attr);
+    })
+    """
 
+    async def bulk_extract(self, spec: list[dict[str, str]]) -> list[str|None]:
+        """
+        Extract text or attributes for several selectors with one round-trip to the page.
+        Each item in spec is a dict of {"selector": ..., "attr": ...}, where attr "text" means the element's text.
+        Unlike extract_many, only the first element matching each selector is used.
 
+        Args:
+            spec (list[dict[str, str]]): The selectors and attributes to extract.
 
+        Returns:
+            list[str|None]: The text or attribute for each item, in the same order as spec.
+                None if nothing matches the selector.
+        """
+        if not spec:
+            return []
+        return await self.page.evaluate(self._BULK_EXTRACT_JS, spec)
 
 
 
 
 
 
-class AbstractScraper(ABC):
+
+
+
+
+
+
+class AbstractScraper(_CrawlDelayMixin, ABC):
     """
     Abstract class for a JS-friendly webscraper.
     Designed for 5 child classes: Sync Playwright, Async Playwright, Selenium, Requests, and Aiohttp.
@@ -297,6 +846,7 @@ class AbstractScraper(ABC):
                  domain: str,
                  browser_controller: AsyncAbstractBrowserController | SyncAbstractBrowserController,
                  user_agent: str="*", 
+                 limit_per_host: int=4,
                  **launch_kwargs):
         self.launch_kwargs = launch_kwargs
         self.browser_controller: AbstractDriver | AbstractInstance = browser_controller
@@ -304,9 +854,17 @@ class AbstractScraper(ABC):
         self.user_agent: str = user_agent
         self.rp: RobotFileParser = RobotFileParser()
         self.browser: AbstractBrowser = None
-        self.crawl_delay: int = None
+        self.crawl_delay: float = None
         self.rrate: NamedTuple = None
 
+        # Pooled HTTP session shared by every async fetch. Created lazily, since it needs a running event loop.
+        self.limit_per_host: int = limit_per_host
+        self._session: aiohttp.ClientSession = None
+
+        # Host-wide crawl delay, shared across all concurrent fetches.
+        self._crawl_delay_lock: asyncio.Lock = asyncio.Lock()
+        self._next_request_time: float = 0.0
+
         if not browser_controller:
             raise ValueError("Driver or Instance missing from scraper keyword arguments")
 
@@ -329,10 +887,10 @@ class AbstractScraper(ABC):
         self.rrate = self.rp.request_rate(self.user_agent)
 
         # Set the crawl delay
-        self.crawl_delay = int(self.rp.crawl_delay(self.user_agent))
+        self.crawl_delay = float(self.rp.crawl_delay(self.user_agent) or 0)
         return
 
-    def can_fetch(self, url: str) -> tuple[bool, int]:
+    def can_fetch(self, url: str) -> tuple[bool, float]:
         fetch = True if self.rp.can_fetch(self.user_agent, url) else False
         return fetch, self.crawl_delay
 
@@ -354,6 +912,32 @@ class AbstractScraper(ABC):
     def close(self) -> None:
         self._close_browser()
 
+    async def async_close(self) -> None:
+        """
+        Close the shared aiohttp session, then the browser. Async scrapers should call this instead of close.
+        """
+        await self._close_session()
+        self._close_browser()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use.
+        Child classes' _async_fetch_urls_from_page should fetch with it, and async_close closes it.
+        Reusing one session lets TLS handshakes and DNS lookups be amortized across fetches.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=self.limit_per_host, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=15))
+        return self._session
+
+    async def _close_session(self) -> None:
+        """
+        Close the shared aiohttp session, if one was opened.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def _load_browser(self) -> None:
         """
         Launch a browser.
@@ -435,3 +1019,29 @@ class AbstractScraper(ABC):
         else:
             time.sleep(delay)
             return self._fetch_urls_from_page(url)
+
+    async def _async_respectful_fetch(self, url: str) -> dict[str]|dict[None]:
+        """
+        Async version of _respectful_fetch.
+        Waits out the delay specified in robots.txt with asyncio.sleep, so other tasks can run in the meantime.
+        """
+        fetch, delay = self.can_fetch(url)
+        if not fetch:
+            logger.warning(f"Cannot scrape URL '{url}' as it's disallowed in robots.txt")
+            return None
+        else:
+            await self._wait_for_crawl_delay(delay)
+            return await self._async_fetch_urls_from_page(url)
+
+    async def _async_respectful_fetch_many(self, urls: list[str], concurrency: int=None) -> list[dict[str]|dict[None]|None]:
+        """
+        Fetch URLs concurrently with _async_respectful_fetch.
+        At most concurrency fetches run at once (defaults to limit_per_host). Disallowed URLs are returned as None.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.limit_per_host)
+
+        async def _bounded_fetch(url: str) -> dict[str]|dict[None]|None:
+            async with semaphore:
+                return await self._async_respectful_fetch(url)
+
+        return await asyncio.gather(*[_bounded_fetch(url) for url in urls])
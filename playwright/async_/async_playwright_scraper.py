@@ -1,13 +1,17 @@
 import abc
 import asyncio
-from functools import wraps
+from collections import defaultdict
+from functools import lru_cache, wraps
+import heapq
 import os
-from typing import Any, Coroutine
-from urllib.robotparser import RobotFileParser
-from urllib.parse import urljoin, urlsplit, urlparse
+import time
+from typing import Any, Coroutine, NamedTuple
+from urllib.parse import urljoin, urlsplit
+import weakref
 
 
 import aiohttp
+import httpx
 # These are imported primarily for type hinting.
 from playwright.async_api import (
     PlaywrightContextManager as AsyncPlaywrightContextManager,
@@ -25,12 +29,236 @@ from utils.shared.sanitize_filename import sanitize_filename
 from utils.shared.decorators.try_except import try_except, async_try_except
 from utils.shared.make_id import make_id
 
+from web_scraper.playwright.async_.utils.robots_txt_parser import RobotsTxtParser
+
 from config.config import OUTPUT_FOLDER, PROJECT_ROOT
 
 from logger.logger import Logger
 logger = Logger(logger_name=__name__)
 
 
+# Parsed robots.txt files shared by every scraper in the process, keyed by domain name.
+# Values are (parser, time fetched).
+_ROBOTS_CACHE: dict[str, tuple[RobotsTxtParser, float]] = {}
+# Per-domain locks, so concurrent scrapers for the same domain fetch its robots.txt only once,
+# without holding up scrapers for other domains. Locks are bound to the event loop that uses them,
+# so they're kept per loop, and a later asyncio.run() gets fresh ones.
+_ROBOTS_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, defaultdict[str, asyncio.Lock]] = weakref.WeakKeyDictionary()
+
+
+def _get_robots_locks() -> defaultdict[str, asyncio.Lock]:
+    """
+    Get the running loop's per-domain robots.txt locks.
+    """
+    return _ROBOTS_LOCKS.setdefault(asyncio.get_running_loop(), defaultdict(asyncio.Lock))
+
+# Google only reads the first 500 KB of a robots.txt file.
+_ROBOTS_TXT_MAX_BYTES = 500 * 1024
+
+
+# RFC 9309 says crawlers should follow at least 5 redirects for robots.txt.
+# This matches aiohttp's default.
+_MAX_REDIRECTS = 10
+
+
+class HttpClientError(Exception):
+    """
+    Raised by an HttpClient when a request fails or times out.
+    """
+
+
+class HttpClient(abc.ABC):
+    """
+    A minimal async HTTP client for the scraper's non-browser requests (e.g. robots.txt).
+    Implementations follow redirects, since robots.txt often redirects (e.g. http to https, or to www).
+    Clients are meant to live as long as the scraper, so their connection pools and keep-alives get reused.
+    """
+    @abc.abstractmethod
+    async def get_text(self, url: str, max_bytes: int=None) -> tuple[int, str]:
+        """
+        GET a URL and decode its body as UTF-8.
+
+        Args:
+            url (str): The URL to get.
+            max_bytes (int, optional): Stop reading the body after this many bytes. Defaults to None (read it all).
+
+        Returns:
+            tuple[int, str]: The response's status code and body. The body is empty unless the status is 200.
+
+        Raises:
+            HttpClientError: If the request fails or times out.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def aclose(self) -> None:
+        """
+        Close the client and its connections.
+        """
+        pass
+
+
+class HttpxClient(HttpClient):
+    """
+    The default HttpClient. httpx's pool keeps connections to many hosts alive more reliably than aiohttp's connector.
+
+    Parameters:
+        client (httpx.AsyncClient, optional): A client to wrap. If None, one is made with a pool sized for crawling.
+    """
+    def __init__(self, client: httpx.AsyncClient=None) -> None:
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=10,
+            follow_redirects=True,
+            max_redirects=_MAX_REDIRECTS,
+        )
+
+    async def get_text(self, url: str, max_bytes: int=None) -> tuple[int, str]:
+        try:
+            # Follow redirects even on a client passed in by the caller, like aiohttp does.
+            async with self._client.stream("GET", url, follow_redirects=True) as response:
+                if response.status_code != 200:
+                    return response.status_code, ""
+                body = bytearray()
+                async for chunk in response.aiter_bytes(64 * 1024):
+                    body += chunk
+                    if max_bytes is not None and len(body) >= max_bytes:
+                        break
+        except httpx.HTTPError as e:
+            raise HttpClientError(f"{type(e).__qualname__}: {e}") from e
+        return response.status_code, body[:max_bytes].decode("utf-8", errors="replace")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class AiohttpClient(HttpClient):
+    """
+    An HttpClient backed by aiohttp.
+
+    Parameters:
+        session (aiohttp.ClientSession, optional): A session to wrap. If None, one is opened on first use.
+    """
+    def __init__(self, session: aiohttp.ClientSession=None) -> None:
+        self._session = session
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10))
+        return self._session
+
+    async def get_text(self, url: str, max_bytes: int=None) -> tuple[int, str]:
+        try:
+            async with self._get_session().get(url, allow_redirects=True, max_redirects=_MAX_REDIRECTS) as response:
+                if response.status != 200:
+                    return response.status, ""
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body += chunk
+                    if max_bytes is not None and len(body) >= max_bytes:
+                        break
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise HttpClientError(f"{type(e).__qualname__}: {e}") from e
+        return response.status, body[:max_bytes].decode("utf-8", errors="replace")
+
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class ConcurrencySettings(NamedTuple):
+    """
+    Limits on how hard all the scrapers in a process may hit a single domain.
+
+    Attributes:
+        max_concurrency (int): Maximum number of navigations in flight at once. Defaults to 1.
+        max_tasks_per_minute (float, optional): Maximum number of navigations started per minute. Defaults to None (no limit).
+    """
+    max_concurrency: int = 1
+    max_tasks_per_minute: float = None
+
+
+class _CreditSemaphore:
+    """
+    A semaphore whose credits are only refunded some time after each task finishes.
+    With a refund time equal to the crawl delay, this honors robots.txt as an aggregate rate
+    while still letting up to max_concurrency navigations overlap.
+
+    Each credit not in use is stored as the monotonic time it can next be used,
+    so refunds don't depend on timer callbacks that are lost if the event loop stops first.
+    """
+    def __init__(self, settings: ConcurrencySettings) -> None:
+        self._sem = asyncio.Semaphore(settings.max_concurrency)
+        # A min-heap of when each free credit can next be used. Holding the semaphore guarantees one is free.
+        self._ready_at: list[float] = [0.0] * settings.max_concurrency
+        self._min_interval: float = 60 / settings.max_tasks_per_minute if settings.max_tasks_per_minute else 0
+        self._start_lock = asyncio.Lock()
+        self._next_start: float = 0.0
+
+    async def transact(self, coro: Coroutine, refund_time: float=0) -> Any:
+        """
+        Run a coroutine once a credit is available, refunding the credit refund_time seconds after it finishes.
+        """
+        try:
+            await self._sem.acquire()
+        except BaseException:
+            coro.close() # Don't leave the coroutine un-awaited if we're cancelled while waiting.
+            raise
+        ready_at = heapq.heappop(self._ready_at)
+        started = False
+        try:
+            wait = ready_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self._min_interval:
+                async with self._start_lock:
+                    wait = self._next_start - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self._next_start = time.monotonic() + self._min_interval
+            started = True
+            return await coro
+        finally:
+            if not started:
+                coro.close()
+                heapq.heappush(self._ready_at, ready_at)
+            else:
+                heapq.heappush(self._ready_at, time.monotonic() + max(refund_time, 0))
+            self._sem.release()
+
+
+# Chromium flags that cut memory use and launch time for crawling.
+# User-supplied launch args are appended after these.
+LEAN_CHROMIUM_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-accelerated-2d-canvas",
+    "--no-first-run",
+    "--disable-background-networking",
+)
+
+
+# Resource types callers usually don't need when they only want a page's HTML.
+BLOCKABLE_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+# Credit semaphores shared by every scraper on an event loop, keyed by loop, then domain name.
+# asyncio primitives belong to the loop they're first used on, so each loop (e.g. each asyncio.run) gets its own.
+_DOMAIN_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _CreditSemaphore]] = weakref.WeakKeyDictionary()
+
+
+def _get_domain_semaphore(domain_name: str, settings: ConcurrencySettings) -> _CreditSemaphore:
+    """
+    Get the running loop's credit semaphore for a domain. The settings of the first scraper for a domain are used.
+    """
+    semaphores = _DOMAIN_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    if domain_name not in semaphores:
+        semaphores[domain_name] = _CreditSemaphore(settings)
+    return semaphores[domain_name]
+
+
+@lru_cache(maxsize=4096)
 def _extract_domain_name_from_url(url: str) -> str:
     """
     Extract the domain name from a given URL.
@@ -41,7 +269,7 @@ def _extract_domain_name_from_url(url: str) -> str:
     Returns:
         str: The extracted domain name.
     """
-    parsed_url = urlparse(url)
+    parsed_url = urlsplit(url)
     domain = parsed_url.netloc or parsed_url.path.split('/')[0]
     parts = domain.split('.')
     if len(parts) > 2:
@@ -49,6 +277,70 @@ def _extract_domain_name_from_url(url: str) -> str:
     return parts[0]
 
 
+def _coerce_screenshot_filename(filename: str, prefix: str=None) -> str:
+    """
+    Coerce a filename, or a URL, to a valid screenshot filename, then add an optional prefix.
+
+    Args:
+        filename (str): The filename or URL to coerce. Anything that isn't a .png or .jpeg becomes a .jpeg.
+        prefix (str, optional): Prefix to add to the filename, separated by an underscore. Defaults to None.
+
+    Returns:
+        str: The coerced filename.
+    """
+    lowered = filename.lower()
+    if not lowered.endswith(('.png', '.jpeg')):
+        logger.debug(f"filename argument: {filename}")
+
+        if lowered.startswith(('http://', 'https://')):
+            logger.warning(f"'take_screenshot' method was given a URL as a filename. Coercing to valid filename...")
+            # Take the last path segment of the URL, ignoring any query or fragment.
+            tail = filename.partition('?')[0].partition('#')[0].rpartition('/')[2]
+            filename = f"{tail}.jpeg"
+        else:
+            logger.warning(f"'take_screenshot' method was given an invalid picture type. Coercing to jpeg...")
+            #Split off the extension and add .jpg
+            filename = f"{os.path.splitext(filename)[0]}.jpeg"
+
+    if prefix:
+        filename = f"{prefix}_{filename}"
+        logger.info(f"Filename prefix '{prefix}' added to '{filename}'")
+    return filename
+
+
+# NOTE These are blocking, so the scraper runs them with asyncio.to_thread to keep the event loop free.
+def _read_text_file(path: str, max_chars: int=-1) -> str|None:
+    """
+    Read up to max_chars characters from a text file, or return None if it doesn't exist.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read(max_chars)
+    except FileNotFoundError:
+        return None
+
+
+def _write_text_file(path: str, content: str, chunk_size: int=64 * 1024) -> None:
+    """
+    Write content to a text file, creating its directory if needed.
+    The content is written in chunks, so only one chunk at a time is held as encoded bytes
+    rather than a second, full-size copy of the content.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(0, len(content), chunk_size):
+            f.write(content[i:i + chunk_size])
+
+
+def _replace_text_file(path: str, content: str) -> None:
+    """
+    Atomically replace a text file's content, so a crash mid-write can't leave a truncated file behind.
+    """
+    tmp_path = f"{path}.tmp"
+    _write_text_file(tmp_path, content)
+    os.replace(tmp_path, path)
+
+
 class AsyncPlaywrightScrapper:
     """
     A Playwright browser class.
@@ -57,6 +349,18 @@ class AsyncPlaywrightScrapper:
         domain (str): The domain to scrape.
         pw_instance (AsyncPlaywrightContextManager): The Playwright instance to use.
         user_agent (str, optional): The user agent string to use. Defaults to "*".
+        http_client (HttpClient, optional): An HTTP client to share with other scrapers, e.g. an AiohttpClient.
+            A bare aiohttp.ClientSession is also accepted.
+            If None, the scraper opens its own HttpxClient on first use and closes it on exit. Defaults to None.
+        robots_ttl (float, optional): How long a parsed robots.txt is reused in-process, in seconds. Defaults to 6 hours.
+        browser_recycle_every (int, optional): Relaunch the browser after this many navigations. Defaults to 50.
+        concurrency_settings (ConcurrencySettings, optional): Per-domain limits shared by all scrapers in the process.
+            Defaults to one navigation at a time with no per-minute limit.
+            max_concurrency only applies across scrapers. Each scraper has one page, so it navigates one URL at a time.
+        block_resources (set[str], optional): Resource types to skip downloading, e.g. BLOCKABLE_RESOURCE_TYPES.
+            Defaults to None (download everything).
+        browser (AsyncPlaywrightBrowser, optional): An already-launched browser to share with other scrapers.
+            The scraper won't launch, relaunch, or close a shared browser. Defaults to None.
         **launch_kwargs: Additional keyword arguments to pass to the browser launch method.
 
     Notes:
@@ -65,9 +369,9 @@ class AsyncPlaywrightScrapper:
         domain (str): The domain being scraped.
         user_agent (str): The user agent string.
         sanitized_filename (str): A sanitized version of the domain for use in filenames.
-        rp (RobotFileParser): The parsed robots.txt file for the domain.
+        rp (RobotsTxtParser): The parsed robots.txt file for the domain.
         request_rate (float): The request rate specified in robots.txt.
-        crawl_delay (int): The crawl delay specified in robots.txt.
+        crawl_delay (float): The crawl delay specified in robots.txt, in seconds.
         browser (AsyncPlaywrightBrowser): The Playwright browser instance (initialized as None).
         context (AsyncPlaywrightBrowserContext): The browser context (initialized as None).
         page (AsyncPlaywrightPage): The current page (initialized as None).
@@ -77,94 +381,161 @@ class AsyncPlaywrightScrapper:
                  domain: str,
                  pw_instance: AsyncPlaywrightContextManager,
                  user_agent: str="*",
+                 http_client: HttpClient|aiohttp.ClientSession=None,
+                 robots_ttl: float=6 * 60 * 60,
+                 browser_recycle_every: int=50,
+                 concurrency_settings: ConcurrencySettings=None,
+                 block_resources: set[str]=None,
+                 browser: AsyncPlaywrightBrowser=None,
                  **launch_kwargs):
 
+        # Launch headless with lean flags unless told otherwise.
+        launch_kwargs.setdefault("headless", True)
+        launch_kwargs["args"] = [*LEAN_CHROMIUM_ARGS, *launch_kwargs.get("args", [])]
         self.launch_kwargs = launch_kwargs
         self.pw_instance: AsyncPlaywrightContextManager = pw_instance
         self.domain: str = domain
         self.user_agent: str = user_agent
         self.sanitized_filename = sanitize_filename(self.domain)
+        self._domain_name: str = _extract_domain_name_from_url(self.domain)
         self.output_dir = os.path.join(OUTPUT_FOLDER, self.sanitized_filename)
 
         # Create the output directory if it doesn't exist.
-        if not os.path.exists(self.output_dir):
-            os.mkdir(os.path.dirname(self.output_dir))
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._ready_dirs: set[str] = {self.output_dir}
 
         # Get the robots.txt properties and assign them.
-        self.rp: RobotFileParser = None
+        self.rp: RobotsTxtParser = None
+        self.robots_ttl: float = robots_ttl
         self.request_rate: float = None
-        self.crawl_delay: int = None
+        self.crawl_delay: float = None
 
-        self.browser: AsyncPlaywrightBrowser = None
-        self.context: AsyncPlaywrightBrowserContext = None,
+        self.browser: AsyncPlaywrightBrowser = browser
+        self._owns_browser: bool = browser is None
+        self.context: AsyncPlaywrightBrowserContext = None
         self.page: AsyncPlaywrightPage = None
         self.screenshot_path = None
 
+        # Playwright only frees a page's memory when its context is closed,
+        # so each navigation gets a fresh context and the browser itself is relaunched periodically.
+        # Cookies and local storage are carried over, so this is transparent to callers.
+        self.browser_recycle_every: int = browser_recycle_every
+        self._ctx_uses: int = 0
+        self._storage_state: dict = None
+        self.block_resources: frozenset[str] = frozenset(block_resources or ())
+
+        # Navigations to this domain are rate-limited by a credit semaphore shared with other scrapers for it.
+        self.concurrency_settings: ConcurrencySettings = concurrency_settings or ConcurrencySettings()
+        # A scraper has only one page and context at a time, so its own navigations run one after another.
+        self._nav_lock = asyncio.Lock()
+
+        # HTTP client for non-browser requests (e.g. robots.txt).
+        # Kept for the scraper's lifetime so its connection pool and keep-alives are reused.
+        if isinstance(http_client, aiohttp.ClientSession):
+            http_client = AiohttpClient(http_client)
+        self._http: HttpClient = http_client
+        self._owns_http: bool = http_client is None
+
+    def _get_http_client(self) -> HttpClient:
+        """
+        Get the scraper's HTTP client, opening it on first use.
+        """
+        if self._http is None:
+            self._http = HttpxClient()
+            self._owns_http = True
+        return self._http
+
+    async def close_http_client(self) -> None:
+        """
+        Close the scraper's HTTP client, unless it was passed in by the caller.
+        """
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            logger.debug("HTTP client closed successfully.")
+        return
+
     # Define class enter and exit methods.
 
     async def _get_robot_rules(self) -> None:
         """
         Get the site's robots.txt file and read it asynchronously with a timeout.
+        Parsed files are cached for the whole process, so scrapers for the same domain only read it once per TTL.
         TODO Make a database of robots.txt files. This might be a good idea for scraping.
         """
         robots_url = urljoin(self.domain, 'robots.txt')
-
-        # Check if we already got the robots.txt file for this website
-        domain_name = _extract_domain_name_from_url(self.domain)
-        robots_txt_filepath = os.path.join(PROJECT_ROOT, "web_scraper", "sites", domain_name, f"{domain_name}_robots.txt")
-        e_tuple: tuple = None
-
-        self.rp = RobotFileParser(robots_url)
-
-        # If we already got the robots.txt file, load it in.
-        if os.path.exists(robots_txt_filepath):
-            logger.info(f"Using cached robots.txt file for '{self.domain}'...")
-            with open(robots_txt_filepath, 'r') as f:
-                content = f.read()
-                self.rp.parse(content.splitlines())
-    
-        else: # Get the robots.txt file from the server if we don't have it.
-            async with aiohttp.ClientSession() as session:
-                try:
-                    logger.info(f"Getting robots.txt from '{robots_url}'...")
-                    async with session.get(robots_url, timeout=10) as response:  # 10 seconds timeout
-                        if response.status == 200:
-                            logger.info("robots.txt response ok")
-                            content = await response.text()
-                            self.rp.parse(content.splitlines())
-                        else:
-                            logger.warning(f"Failed to fetch robots.txt: HTTP {response.status}")
-                            return None
-                except asyncio.TimeoutError as e:
-                    e_tuple = (e.__qualname__, e)
-                except aiohttp.ClientError as e:
-                    e_tuple = (e.__qualname__, e)
-                finally:
-                    if e_tuple:
-                        mes = f"{e_tuple[0]} while fetching robots.txt from '{robots_url}': {e_tuple[1]}"
-                        logger.warning(mes)
-                        return None
-                    else:
-                        logger.info(f"Got robots.txt for {self.domain}")
-                        logger.debug(f"content:\n{content}",f=True)
-
-            # Save the robots.txt file to disk.
-            if not os.path.exists(robots_txt_filepath):
-                with open(robots_txt_filepath, 'w') as f:
-                    f.write(content)
+        domain_name = self._domain_name
+
+        robots_locks = _get_robots_locks()
+        async with robots_locks[domain_name]:
+            # Check the cache after getting the lock, since another scraper may have just filled it.
+            cached = _ROBOTS_CACHE.get(domain_name)
+            if cached and time.time() - cached[1] < self.robots_ttl:
+                logger.debug(f"Using in-memory robots.txt for '{self.domain}'")
+                self.rp = cached[0]
+            else:
+                self.rp = RobotsTxtParser(robots_url)
+                if not await self._read_robots_txt(robots_url, domain_name):
+                    return None
+                _ROBOTS_CACHE[domain_name] = (self.rp, time.time())
+                # The cache now answers for this domain, so drop the lock to keep the dict bounded.
+                robots_locks.pop(domain_name, None)
 
         # Set the request rate and crawl delay from the robots.txt file.
         self.request_rate: float = self.rp.request_rate(self.user_agent) or 0
         logger.info(f"request_rate set to {self.request_rate}")
-        self.crawl_delay: int = int(self.rp.crawl_delay(self.user_agent))
+        self.crawl_delay: float = self.rp.crawl_delay(self.user_agent) or 0
         logger.info(f"crawl_delay set to {self.crawl_delay}")
         return
 
+
+    async def _read_robots_txt(self, robots_url: str, domain_name: str) -> bool:
+        """
+        Read the site's robots.txt file from disk, or from the server if we don't have it, and parse it into self.rp.
+        Like Google, only the first 500 KB of the file is parsed.
+
+        Returns:
+            bool: True if the file was read and parsed, False otherwise.
+        """
+        # Check if we already got the robots.txt file for this website
+        robots_txt_filepath = os.path.join(PROJECT_ROOT, "web_scraper", "sites", domain_name, f"{domain_name}_robots.txt")
+
+        # If we already got the robots.txt file, load it in.
+        content = await asyncio.to_thread(_read_text_file, robots_txt_filepath, _ROBOTS_TXT_MAX_BYTES)
+        if content is not None:
+            logger.info(f"Using cached robots.txt file for '{self.domain}'...")
+            self.rp.parse(content.splitlines())
+            return True
+
+        # Get the robots.txt file from the server if we don't have it.
+        # The client streams the body and stops reading once it hits the size cap.
+        # NOTE robots.txt files are UTF-8 per RFC 9309.
+        try:
+            logger.info(f"Getting robots.txt from '{robots_url}'...")
+            status, content = await self._get_http_client().get_text(robots_url, max_bytes=_ROBOTS_TXT_MAX_BYTES)
+        except HttpClientError as e:
+            logger.warning(f"Error while fetching robots.txt from '{robots_url}': {e}")
+            return False
+        if status != 200:
+            logger.warning(f"Failed to fetch robots.txt: HTTP {status}")
+            return False
+        logger.info("robots.txt response ok")
+        self.rp.parse(content.splitlines())
+        logger.info(f"Got robots.txt for {self.domain}")
+        logger.debug(f"content:\n{content}",f=True)
+
+        # Save the robots.txt file to disk.
+        await asyncio.to_thread(_replace_text_file, robots_txt_filepath, content)
+        return True
+
     @async_try_except(exception=[AsyncPlaywrightTimeoutError, AsyncPlaywrightError], raise_exception=True)
     async def _load_browser(self) -> None:
         """
-        Launch a chromium browser instance.
+        Launch a chromium browser instance, unless one was passed in to share.
         """
+        if not self._owns_browser:
+            logger.debug("Using shared Playwright Chromium instance.")
+            return
         logger.debug("Launching Playwright Chromium instance...")
         self.browser = await self.pw_instance.chromium.launch(**self.launch_kwargs)
         logger.debug(f"Playwright Chromium browser instance launched successfully.\nkwargs:{self.launch_kwargs}",f=True)
@@ -179,8 +550,8 @@ class AsyncPlaywrightScrapper:
         """
         logger.debug("Starting AsyncPlaywrightScrapper via factory method...")
         instance = cls(domain, pw_instance, *args, **kwargs)
-        await instance._get_robot_rules()
-        await instance._load_browser()
+        # These are independent, so get robots.txt while the browser launches.
+        await asyncio.gather(instance._get_robot_rules(), instance._load_browser())
         return instance
 
 
@@ -189,15 +560,16 @@ class AsyncPlaywrightScrapper:
         """
         Close any remaining page, context, and browser instances before exit.
         """
-        self.close_current_page_and_context()
-        if self.browser:
+        await self.close_current_page_and_context()
+        if self.browser and self._owns_browser:
             await self.close_browser()
+        await self.close_http_client()
         return
 
 
     async def __aenter__(self) -> 'AsyncPlaywrightScrapper':
-        await self._get_robot_rules()
-        return await self._load_browser()
+        await asyncio.gather(self._get_robot_rules(), self._load_browser())
+        return self
 
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -206,13 +578,26 @@ class AsyncPlaywrightScrapper:
 
     # NOTE We make these individual function's so that we can orchestrate them more granularly
     # in within larger functions within the class. 
-    async def open_new_context(self, **kwargs) -> AsyncPlaywrightBrowserContext:
+    async def open_new_context(self, block_resources: set[str]=None, **kwargs) -> AsyncPlaywrightBrowserContext:
         """
         Open a new browser context.
+
+        Args:
+            block_resources (set[str], optional): Resource types to abort for every page in the context,
+                e.g. BLOCKABLE_RESOURCE_TYPES. Defaults to the scraper's block_resources.
+            **kwargs: Additional keyword arguments to pass to the browser.new_context() method.
         """
         if self.browser:
             self.context = await self.browser.new_context(**kwargs)
             logger.debug("Browser context created successfully.")
+
+            # NOTE The route is attached to the context rather than each page, 
+            # since page routes leak in long sessions and contexts are rotated anyway.
+            block = block_resources if block_resources is not None else self.block_resources
+            if block:
+                await self.context.route(
+                    "**/*", lambda route: route.abort() if route.request.resource_type in block else route.continue_()
+                )
             return
         else:
             raise AttributeError("'browser' attribute is missing or not initialized.")
@@ -248,6 +633,7 @@ class AsyncPlaywrightScrapper:
         Close a browser context.
         """
         await self.context.close()
+        self.context = None
         logger.debug("Browser context closed successfully.")
         return
 
@@ -257,6 +643,7 @@ class AsyncPlaywrightScrapper:
         Close a browser page instance.
         """
         await self.page.close()
+        self.page = None
         logger.debug("Page instance closed successfully")
         return
 
@@ -268,7 +655,25 @@ class AsyncPlaywrightScrapper:
             await self.close_context()
         return
 
-    @try_except(exception=[AsyncPlaywrightTimeoutError, AsyncPlaywrightError], raise_exception=True)
+    async def _rotate_context(self) -> None:
+        """
+        Close the current page and context, saving their storage state for the next context.
+        Every browser_recycle_every calls, the browser is relaunched too.
+        """
+        if self.context:
+            self._storage_state = await self.context.storage_state()
+        await self.close_current_page_and_context()
+
+        self._ctx_uses += 1
+        if self._owns_browser and self._ctx_uses >= self.browser_recycle_every:
+            logger.debug(f"Relaunching browser after {self._ctx_uses} navigations...")
+            await self.close_browser()
+            await self._load_browser()
+            self._ctx_uses = 0
+        return
+
+    # NOTE The thin wrappers below aren't wrapped in try_except, since it would only re-raise.
+    # Errors are handled by the orchestrated methods that call them.
     async def wait_till_idle(self) -> Coroutine[Any, Any, None]:
         """
         Wait for a page to fully finish loading.
@@ -279,7 +684,12 @@ class AsyncPlaywrightScrapper:
     # These function's put all the small bits together.
 
     @try_except(exception=[AsyncPlaywrightTimeoutError, AsyncPlaywrightError])
-    async def navigate_to(self, url: str, idx: int = None, crawl_override: int|float = None, **kwargs) -> Coroutine:
+    async def navigate_to(self, 
+                          url: str, 
+                          idx: int = None, 
+                          crawl_override: int|float = None, 
+                          wait_for: str = None,
+                          **kwargs) -> Coroutine:
         """
         Open a specified webpage and wait for any dynamic elements to load.
         This method respects robots.txt rules (e.g. not scrape disallowed URLs, respects crawl delays).
@@ -287,9 +697,11 @@ class AsyncPlaywrightScrapper:
 
         Args:
             url (str): The URL of the webpage to navigate to.
-            idx (int, optional): Index of the current request, used for applying delays. Defaults to None.
+            idx (int, optional): No longer used. The first request to a domain is never delayed. Defaults to None.
             crawl_override (int|float, optional): Override the crawl delay specified in robots.txt. Defaults to None.
-            **kwargs: Additional keyword arguments to pass to the page.goto() method.
+            wait_for (str, optional): Selector of an element to wait for after the DOM has loaded. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the page.goto() method. 
+                wait_until defaults to "domcontentloaded".
 
         Returns:
             Coroutine: A coroutine that resolves when the page has finished loading.
@@ -301,36 +713,50 @@ class AsyncPlaywrightScrapper:
         Note:
             - The method cleans up URLs by replacing '%2C' with ','.
             - It checks if scraping is allowed for the URL according to robots.txt.
-            - Applies a delay between requests based on robots.txt or the crawl_override parameter.
-            - Opens a new context and page for each navigation.
-            - Waits for the page to fully load before returning.
+            - Spaces out requests to the domain based on robots.txt or the crawl_override parameter.
+              The delay is applied through a credit semaphore shared by all scrapers for the domain, 
+              rather than by sleeping before each request.
+            - Concurrent calls on the same scraper run one after another, since they share its page and context.
+              Use several scrapers to navigate a domain concurrently.
+            - Closes the previous page and context, then opens a new context and page for each navigation.
+            - Relaunches the browser every browser_recycle_every navigations to keep memory bounded.
+            - Waits for the DOM to load, and for the wait_for element to be visible if given, before returning.
+              Call wait_till_idle afterwards if the page's network traffic really needs to settle.
         """
         # Clean up the URL.
-        if "%2C" in url:
-            url = re.sub("%2C", ",", url)
+        url = url.replace("%2C", ",")
 
         # See if we're allowed to get the URL, as well as get the specified delay from robots.txt
         if not self.rp.can_fetch(self.user_agent, url):
             logger.warning(f"Cannot scrape URL '{url}' as it's disallowed in robots.txt")
             return
 
-        # Wait per the robots.txt crawl delay or override delay.
-        if idx is not None and idx > 1: # Round up since crawl_override can be either a float or int.
-            delay = crawl_override if crawl_override and int(math.ceil(crawl_override)) > 0 else self.crawl_delay
-            if delay > 0:
-                logger.info(f"Sleeping for {delay} seconds per {'crawl override' if crawl_override else 'robots.txt crawl delay'}")
-                await asyncio.sleep(delay)
+        # Hold a credit for the robots.txt crawl delay or override delay after the page loads.
+        delay = crawl_override if crawl_override and crawl_override > 0 else self.crawl_delay or 0
+        bucket = _get_domain_semaphore(self._domain_name, self.concurrency_settings)
+        async with self._nav_lock:
+            return await bucket.transact(self._do_goto(url, wait_for=wait_for, **kwargs), refund_time=delay)
+
 
-        # Open a new context and page.
-        await self.open_new_context()
+    async def _do_goto(self, url: str, wait_for: str = None, **kwargs) -> Coroutine:
+        """
+        Open a fresh context and page, go to the URL, and wait for it to load.
+        """
+        # Close the previous page and context before opening new ones.
+        await self._rotate_context()
+        await self.open_new_context(storage_state=self._storage_state)
         await self.open_new_page()
 
-        # Go to the URL and wait for it to fully load.
+        # Go to the URL and wait for the DOM, rather than waiting out every analytics beacon with networkidle.
+        kwargs.setdefault("wait_until", "domcontentloaded")
         await self.page.goto(url, **kwargs)
-        return await self.wait_till_idle()
+
+        # If the caller knows what they need, wait for just that.
+        if wait_for:
+            await self.page.locator(wait_for).wait_for(state="visible")
+        return
 
 
-    @async_try_except(exception=[AsyncPlaywrightTimeoutError, AsyncPlaywrightError], raise_exception=True)
     async def move_mouse_cursor_to_hover_over(self, selector: str, *args, **kwargs) -> Coroutine[Any, Any, None]:
         """
         Move a "mouse" cursor over a specified element.
@@ -338,7 +764,6 @@ class AsyncPlaywrightScrapper:
         return await self.page.locator(selector, *args, **kwargs).hover()
 
 
-    @async_try_except(exception=[AsyncPlaywrightTimeoutError, AsyncPlaywrightError], raise_exception=True)
     async def click_on(self, selector: str, *args, **kwargs) -> Coroutine[Any, Any, None]:
         """
         Click on a specified element.
@@ -350,12 +775,17 @@ class AsyncPlaywrightScrapper:
     async def save_page_html_content_to_output_dir(self, filename: str) -> str:
         """
         Save a page's current HTML content to the output directory.
+        NOTE Playwright returns the page's HTML as one string, so it is released as soon as it's written.
+
+        Returns:
+            str: The path the HTML was saved to.
         """
         path = os.path.join(self.output_dir, filename)
         page_html = await self.page.content()
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(page_html)
-            logger.debug(f"HTML content has been saved to '{filename}'")
+        await asyncio.to_thread(_write_text_file, path, page_html)
+        del page_html
+        logger.debug(f"HTML content has been saved to '{filename}'")
+        return path
 
 
     @async_try_except(exception=[AsyncPlaywrightTimeoutError, AsyncPlaywrightError])
@@ -378,7 +808,8 @@ class AsyncPlaywrightScrapper:
 
         Args:
             filename (str): The name of the file to save the screenshot as.
-            full_page (bool, optional): Whether to capture the full page or just the visible area. Defaults to False.
+            full_page (bool, optional): Whether to capture the full page or just the visible area.
+                Ignored when an element is given. Defaults to False.
             element (str, optional): CSS selector of a specific element to capture. If None, captures the entire page. Defaults to None.
             open_image_after_save (bool, optional): Whether to open the image after saving (only works in WSL). Defaults to False. Currently broken.
             locator_kwargs (dict, optional): Additional keyword arguments for the locator if an element is specified.
@@ -392,31 +823,24 @@ class AsyncPlaywrightScrapper:
             AsyncPlaywrightError: Any unknown Playwright error occurs.
         """
         # Coerce the filename to jpg if it's an unsupported image type.
-        # NOTE This will also work with URLs, since it feeds the filename into the sanitize_filename function first.
-        if not filename.lower().endswith(('.png', '.jpeg')):
-            logger.debug(f"filename argument: {filename}")
-
-            if filename.lower().startswith(('http://', 'https://')):
-                logger.warning(f"'take_screenshot' method was given a URL as a filename. Coercing to valid filename...")
-                # Extract the filename from the URL
-                filename = f"{urlsplit(filename).path.split('/')[-1]}.jpeg"
-            else:
-                logger.warning(f"'take_screenshot' method was given an invalid picture type. Coercing to jpeg...")
-                #Split off the extension and add .jpg
-                filename = f"{os.path.splitext(filename)[0]}.jpeg"
-            
-        if prefix:
-            filename = f"{prefix}_{filename}"
-            logger.info(f"Filename prefix '{prefix}' added to '{filename}'")
-
+        filename = _coerce_screenshot_filename(filename, prefix)
         logger.debug(f"filename: {filename}")
         self.screenshot_path = self._make_filepath_dir_for_domain(filename)
 
+        # Match the image type to the extension so Playwright doesn't re-encode it.
+        # JPEGs default to quality 80, which is about a third the size of 100 with no visible difference.
+        if filename.lower().endswith(".png"):
+            kwargs["type"] = "png"
+        else:
+            kwargs["type"] = "jpeg"
+            kwargs.setdefault("quality", 80)
+
         # Take the screenshot.
+        # Element screenshots are clipped to the element, so full_page would only make Chromium lay out the whole page.
         if element:
-            await self.page.locator(element, **locator_kwargs).screenshot(path=self.screenshot_path, type="jpeg", full_page=full_page, **kwargs)
+            await self.page.locator(element, **(locator_kwargs or {})).screenshot(path=self.screenshot_path, **kwargs)
         else:
-            await self.page.screenshot(path=self.screenshot_path, type="jpeg", full_page=full_page, **kwargs)
+            await self.page.screenshot(path=self.screenshot_path, full_page=full_page, **kwargs)
 
         return
 
@@ -433,9 +857,11 @@ class AsyncPlaywrightScrapper:
         # Define the filepath.
         filepath = os.path.join(self.output_dir, filename)
 
-        # Create the output folder if it doesn't exist.
-        if not os.path.exists(filepath):
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        # Create the output folder if we haven't already.
+        dirpath = os.path.dirname(filepath)
+        if dirpath not in self._ready_dirs:
+            os.makedirs(dirpath, exist_ok=True)
+            self._ready_dirs.add(dirpath)
 
         return filepath
 
@@ -0,0 +1,28 @@
+from protego import Protego, RequestRate
+
+
+class RobotsTxtParser:
+    """
+    An RFC 9309-compliant robots.txt parser with the same methods as urllib's RobotFileParser.
+    urllib's parser misreads grouped User-agent lines, comments after directives, and some Crawl-delay values,
+    so this wraps Protego instead.
+
+    Parameters:
+        url (str, optional): The URL of the robots.txt file. Defaults to ''.
+    """
+    def __init__(self, url: str='') -> None:
+        self.url = url
+        self._protego: Protego = None
+
+    def parse(self, lines: list[str]) -> None:
+        self._protego = Protego.parse("\n".join(lines))
+
+    def can_fetch(self, useragent: str, url: str) -> bool:
+        # Like RobotFileParser, nothing can be fetched until a file has been parsed.
+        return False if self._protego is None else self._protego.can_fetch(url, useragent)
+
+    def crawl_delay(self, useragent: str) -> float|None:
+        return None if self._protego is None else self._protego.crawl_delay(useragent)
+
+    def request_rate(self, useragent: str) -> RequestRate|None:
+        return None if self._protego is None else self._protego.request_rate(useragent)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+
+from web_scraper.selenium.sync.selenium_scraper import SeleniumScraper
+
+from logger.logger import Logger
+logger = Logger(logger_name=__name__)
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+T = TypeVar("T")
+
+
+class AsyncSeleniumScraper:
+    """
+    An asyncio version of SeleniumScraper, so several drivers can scrape concurrently under one event loop.
+
+    Selenium's WebDriver client is blocking, so each call runs SeleniumScraper's method in a worker thread.
+    The browser does the waiting either way, so this overlaps the waits of different drivers,
+    and a wait on one driver no longer holds up the event loop.
+
+    Parameters:
+        driver (webdriver.Chrome): The Chrome webdriver to use.
+        wait_in_seconds (int, optional): Passed on to SeleniumScraper. Defaults to 1.
+    """
+
+    def __init__(self, driver: webdriver.Chrome=None, wait_in_seconds: int=1):
+        self._scraper = SeleniumScraper(driver, wait_in_seconds)
+        # A driver can only run one command at a time.
+        self._lock = asyncio.Lock()
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        return self._scraper.driver
+
+    async def _run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run one of the sync scraper's methods in a worker thread, one at a time.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def __aenter__(self) -> 'AsyncSeleniumScraper':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        await self.exit()
+        return False
+
+    async def exit(self) -> None:
+        """
+        Close the webpage and webdriver.
+        """
+        await self._run(self._scraper.exit)
+
+    async def refresh_page(self) -> None:
+        """
+        Refresh the web page currently in the driver.
+        """
+        await self._run(self._scraper.refresh_page)
+
+    async def make_page(self, url: str, block_resources: bool=True) -> None:
+        """
+        Navigate to the specified URL. See SeleniumScraper.make_page.
+        """
+        await self._run(self._scraper.make_page, url, block_resources=block_resources)
+
+    async def wait_to_fully_load(self, implicit_wait: int=5, page_load_timeout: int=10, class_name: str=None, poll_frequency: float=0.1) -> None:
+        """
+        Wait for the page to fully load. See SeleniumScraper.wait_to_fully_load.
+        """
+        await self._run(self._scraper.wait_to_fully_load,
+                        implicit_wait=implicit_wait,
+                        page_load_timeout=page_load_timeout,
+                        class_name=class_name,
+                        poll_frequency=poll_frequency)
+
+    async def wait_for_and_then_return_elements(self,
+                                                xpath: str,
+                                                wait_time: int = 10,
+                                                poll_frequency: float = 0.1,
+                                                retries: int = 2
+                                                ) -> list[WebElement]:
+        """
+        Wait for elements to be present and interactable on the page, then return them.
+        See SeleniumScraper.wait_for_and_then_return_elements.
+        """
+        return await self._run(self._scraper.wait_for_and_then_return_elements,
+                               xpath, wait_time=wait_time, poll_frequency=poll_frequency, retries=retries)
+
+    async def find_elements_by_xpath(self, url: str, xpath: str, first_elem: bool=True) -> WebElement|list[WebElement]|None:
+        """
+        Find an element or elements on the page. See SeleniumScraper.find_elements_by_xpath.
+        """
+        return await self._run(self._scraper.find_elements_by_xpath, url, xpath, first_elem=first_elem)
+
+    async def press_buttons(self,
+                            xpath: str,
+                            first_button: bool = True,
+                            delay: float = 0.5,
+                            target_buttons: list[str] = None,
+                            post_click_condition: Callable[[WebDriver, WebElement], bool] = None,
+                            wait_for_selector: str = None,
+                            ) -> None:
+        """
+        Press one or multiple buttons identified by the given XPath. See SeleniumScraper.press_buttons.
+        """
+        await self._run(self._scraper.press_buttons,
+                        xpath,
+                        first_button=first_button,
+                        delay=delay,
+                        target_buttons=target_buttons,
+                        post_click_condition=post_click_condition,
+                        wait_for_selector=wait_for_selector)
+
+    async def wait_for_selector(self, selector: str, timeout: float=10, min_count: int=0) -> bool:
+        """
+        Wait for more than min_count elements matching a CSS selector to be on the page. See SeleniumScraper.wait_for_selector.
+        """
+        return await self._run(self._scraper.wait_for_selector, selector, timeout=timeout, min_count=min_count)
+
+
+async def scrape_many(scrapers: list[AsyncSeleniumScraper],
+                      urls: list[str],
+                      scrape_one: Callable[[AsyncSeleniumScraper, str], Awaitable[T]]
+                      ) -> list[T]:
+    """
+    Scrape several URLs concurrently, handing each one to whichever scraper frees up first.
+
+    Args:
+        scrapers (list[AsyncSeleniumScraper]): The scrapers to share the URLs between. Each one scrapes one URL at a time.
+        urls (list[str]): The URLs to scrape.
+        scrape_one (Callable[[AsyncSeleniumScraper, str], Awaitable[T]]): Scrapes one URL with the given scraper,
+            e.g. by calling make_page, then wait_to_fully_load.
+
+    Returns:
+        list[T]: What scrape_one returned for each URL, in the same order as urls.
+    """
+    assert scrapers, "At least one scraper must be provided."
+    idle: asyncio.Queue[AsyncSeleniumScraper] = asyncio.Queue()
+    for scraper in scrapers:
+        idle.put_nowait(scraper)
+
+    async def _scrape(url: str) -> Any:
+        scraper = await idle.get()
+        try:
+            return await scrape_one(scraper, url)
+        finally:
+            idle.put_nowait(scraper)
+
+    logger.debug(f"Scraping {len(urls)} URLs with {len(scrapers)} drivers...")
+    return await asyncio.gather(*(_scrape(url) for url in urls))
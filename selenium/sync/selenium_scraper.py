@@ -1,12 +1,21 @@
 
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+import json
+import os
+import queue
+import re
+import subprocess
+import threading
 import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable
+import weakref
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# The decorators need the exceptions at import time, but they don't pull in the rest of Selenium.
 from selenium.common.exceptions import (
     StaleElementReferenceException, 
     WebDriverException,
@@ -22,6 +31,244 @@ from config.config import LEGAL_WEBSITE_DICT, OUTPUT_FOLDER
 from logger.logger import Logger
 logger = Logger(logger_name=__name__)
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+@cache
+def _lazy() -> SimpleNamespace:
+    """
+    Import the parts of Selenium that are only needed once a scraper is used.
+    Importing any of selenium.webdriver imports every browser's driver, which is slow,
+    so this keeps it out of the import of this module.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    return SimpleNamespace(By=By, EC=EC)
+
+
+class AdaptiveWait:
+    """
+    A stand-in for WebDriverWait that polls quickly at first, then backs off.
+    The first poll comes after half of poll_frequency, and each poll after that waits twice as long, up to max_poll.
+    With the defaults, that's 0.05, 0.1, 0.2, 0.4, then 0.8 seconds.
+
+    Parameters:
+        driver (WebDriver): The driver to wait on.
+        timeout (float): Maximum time to wait, in seconds.
+        poll_frequency (float, optional): Twice the first poll interval, in seconds. Defaults to 0.1.
+        ignored_exceptions (Iterable[type[Exception]], optional): Exceptions to ignore while polling. Defaults to NoSuchElementException.
+        max_poll (float, optional): The longest poll interval, in seconds. Defaults to 0.8.
+    """
+    def __init__(self,
+                 driver: WebDriver,
+                 timeout: float,
+                 poll_frequency: float=0.1,
+                 ignored_exceptions=None,
+                 max_poll: float=0.8):
+        self._driver = driver
+        self._timeout = float(timeout)
+        self._poll = poll_frequency
+        self._max_poll = max_poll
+        self._ignored_exceptions = (NoSuchElementException, *(ignored_exceptions or ()))
+
+    def until(self, method: Callable[[WebDriver], Any], message: str="") -> Any:
+        interval = self._poll / 2
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions:
+                pass
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self._max_poll)
+        raise TimeoutException(message)
+
+
+# One location step of an XPath, e.g. '//div[@class="toc"]', split into its axis, node test, and predicates.
+_XPATH_STEP = re.compile(r"(//|/)([A-Za-z_][\w-]*|\*)((?:\[[^\[\]]*\])*)")
+# A predicate with a CSS equivalent: [@attr], [@attr='value'], [contains(@attr, 'value')], or [starts-with(@attr, 'value')].
+_XPATH_PREDICATE = re.compile(
+    r"""\[\s*(?:"""
+    r"""@(?P<attr>[A-Za-z_][\w-]*)(?:\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'))?"""
+    r"""|(?P<func>contains|starts-with)\(\s*@(?P<fattr>[A-Za-z_][\w-]*)\s*,\s*(?:"(?P<fdq>[^"]*)"|'(?P<fsq>[^']*)')\s*\)"""
+    r""")\s*\]"""
+)
+
+
+def _css_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@lru_cache(maxsize=1024)
+def _xpath_to_css(xpath: str) -> str|None:
+    """
+    Translate an XPath to an equivalent CSS selector, since Chrome matches CSS selectors much faster than XPaths.
+    Only document-wide XPaths made of tag names and simple attribute predicates can be translated,
+    e.g. '//div[@id="toc"]//button[contains(@class, "expand")]' becomes 'div[id="toc"] button[class*="expand"]'.
+
+    Args:
+        xpath (str): The XPath to translate.
+
+    Returns:
+        str|None: The CSS selector, or None if the XPath has no CSS equivalent.
+    """
+    xpath = xpath.strip()
+    if not xpath.startswith("//"):
+        return None
+
+    parts, pos = [], 0
+    while pos < len(xpath):
+        step = _XPATH_STEP.match(xpath, pos)
+        if step is None:
+            return None
+        axis, tag, predicates = step.groups()
+        if parts:
+            parts.append(" " if axis == "//" else " > ")
+
+        selector, pred_pos = tag, 0
+        while pred_pos < len(predicates):
+            pred = _XPATH_PREDICATE.match(predicates, pred_pos)
+            if pred is None:
+                return None
+            if pred["attr"]:
+                value = pred["dq"] if pred["dq"] is not None else pred["sq"]
+                selector += f"[{pred['attr']}]" if value is None else f"[{pred['attr']}={_css_string(value)}]"
+            else:
+                value = pred["fdq"] if pred["fdq"] is not None else pred["fsq"]
+                op = "*=" if pred["func"] == "contains" else "^="
+                selector += f"[{pred['fattr']}{op}{_css_string(value)}]"
+            pred_pos = pred.end()
+
+        parts.append(selector)
+        pos = step.end()
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _locator(xpath: str) -> tuple[str, str]:
+    """
+    Get a Selenium locator for an XPath, using a CSS selector instead if it has an equivalent one.
+    """
+    css = _xpath_to_css(xpath)
+    if css is None:
+        logger.info(f"x-path '{xpath}' has no CSS equivalent. Rewrite it as a CSS selector for faster lookups.")
+        return (_lazy().By.XPATH, xpath)
+    return (_lazy().By.CSS_SELECTOR, css)
+
+
+# True if every element is rendered and not disabled, i.e. what is_displayed() and is_enabled() check,
+# but for a whole list of elements in one round-trip to the browser.
+# NOTE getClientRects() is used instead of offsetParent, since offsetParent is null for position:fixed elements.
+_ALL_INTERACTABLE_JS = "return arguments[0].every(e => e.getClientRects().length > 0 && !e.disabled);"
+
+# The elements whose visible text is one of the given strings, in one round-trip instead of one per element.
+# innerText is what WebElement.text returns.
+_FILTER_BY_TEXT_JS = "return arguments[0].filter(e => arguments[1].includes(e.innerText.trim()));"
+
+# How many elements on the page match a CSS selector.
+_COUNT_SELECTOR_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# Calls back with true as soon as more than the given number of elements match a CSS selector, or with false after a timeout.
+# A MutationObserver lets the browser tell us when it renders, so there's no polling.
+_WAIT_FOR_SELECTOR_JS = """
+const [selector, minCount, timeoutMs, done] = arguments;
+const found = () => document.querySelectorAll(selector).length > minCount;
+if (found()) return done(true);
+const observer = new MutationObserver(() => {
+    if (found()) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+"""
+
+# URL patterns for resources that don't matter for scraping text: images, fonts, video, and analytics.
+# Not downloading them is the cheapest way to make pages load faster.
+BLOCKED_URL_PATTERNS: tuple[str, ...] = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*googletagmanager*", "*google-analytics*",
+)
+
+# How long to wait for the webdriver to shut down before checking whether it's still responding, in seconds.
+# Quitting closes Chrome too, which can take a while on a busy machine.
+_EXIT_TIMEOUT = 30
+
+# How long to give a button without an 'aria-expanded' attribute to react to a click, in seconds.
+_NO_CONDITION_CLICK_DELAY = 0.05
+
+# The W3C default script timeout, in seconds.
+_DEFAULT_SCRIPT_TIMEOUT = 30
+
+# True once Angular has no pending HTTP requests, an element with the given class name is on the page,
+# and the document has finished loading.
+_PAGE_READY_FN_JS = """
+function (className) {
+    const injector = window.angular !== undefined && angular.element(document).injector();
+    return Boolean(injector)
+        && injector.get("$http").pendingRequests.length === 0
+        && document.getElementsByClassName(className).length > 0
+        && document.readyState === "complete";
+}
+"""
+
+# Defines window.__waitForPageReady(className, timeoutMs), a promise that resolves to true once the page is ready,
+# or to false after a timeout. The checks run in the browser, so waiting on it costs one round-trip instead of one per poll.
+# It's pinned to every new document over CDP, so it's only sent and parsed once, not on every wait.
+_PAGE_READY_SCRIPT_JS = """
+window.__pageReady = %s;
+window.__waitForPageReady = (className, timeoutMs) => new Promise(resolve => {
+    const deadline = Date.now() + timeoutMs;
+    (function check() {
+        if (window.__pageReady(className)) return resolve(true);
+        if (Date.now() > deadline) return resolve(false);
+        setTimeout(check, 50);
+    })();
+});
+""" % _PAGE_READY_FN_JS
+
+# The identifier CDP returned for each driver's pinned page ready script.
+# Pinned scripts belong to the driver's tab, not to a scraper, so any scraper on the same driver can see and replace it.
+_PAGE_READY_SCRIPT_IDS: weakref.WeakKeyDictionary[WebDriver, str] = weakref.WeakKeyDictionary()
+
+# Calls back with true once the page is ready, or with false after a timeout, for use with execute_async_script.
+# The page is re-checked whenever the DOM or readyState changes, so waiting on it is a single call to the browser.
+_WAIT_FOR_PAGE_READY_JS = """
+const [className, timeoutMs, recheckMs, done] = arguments;
+const isReady = %s;
+let finished = false;
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    document.removeEventListener("readystatechange", check);
+    clearInterval(recheck);
+    clearTimeout(timer);
+    done(result);
+}
+function check() {
+    if (isReady(className)) finish(true);
+}
+const observer = new MutationObserver(check);
+observer.observe(document, {childList: true, subtree: true});
+document.addEventListener("readystatechange", check);
+// Angular's pending requests don't fire events, so also re-check on a timer.
+const recheck = setInterval(check, recheckMs);
+const timer = setTimeout(() => finish(false), timeoutMs);
+check();
+""" % _PAGE_READY_FN_JS
+
 
 class SeleniumScraper:
 
@@ -29,11 +276,26 @@ class SeleniumScraper:
         self.driver = driver
         self.wait_in_seconds = wait_in_seconds
         self.page = None
+        self._script_timeout: float = _DEFAULT_SCRIPT_TIMEOUT
+        self._blocking_resources: bool = False
+        self._exited: bool = False
+        # Waits hold no state between calls, so one per set of arguments is reused rather than making a new one every call.
+        self._waits: dict[tuple[float, float, float], AdaptiveWait] = {}
 
         if not self.driver:
             logger.error("Chrome webdriver not passed to Selenium.")
             raise ValueError("Chrome webdriver not passed to Selenium.")
 
+    def _wait(self, timeout: float, poll_frequency: float=0.1, max_poll: float=0.8) -> AdaptiveWait:
+        """
+        Get an AdaptiveWait on this scraper's driver with the given arguments.
+        """
+        key = (timeout, poll_frequency, max_poll)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = self._waits[key] = AdaptiveWait(self.driver, timeout, poll_frequency=poll_frequency, max_poll=max_poll)
+        return wait
+
     @try_except(exception=[WebDriverException])
     def close_webpage(self):
         return self.driver.close()
@@ -66,17 +328,48 @@ class SeleniumScraper:
 
     def exit(self):
         """
-        Close the webpage and webdriver.
+        Close the webpage and webdriver. Calling this more than once does nothing.
+        If the driver has crashed, its HTTP retries could hang shutdown for minutes, so a driver whose process
+        has already exited isn't waited on, and one that stops responding is killed.
+        A driver that's still responding is never killed, since that would leave its Chrome running.
         """
-        if self.page:
-            logger.info("Trying to close webpage...")
-            self.close_webpage()
-            logger.info("Webpage closed successfully.")
-        logger.info("Trying to quit webdriver...")
-        self._quit_driver()
-        logger.info("Webdriver quit successfully.")
+        if self._exited:
+            return
+        self._exited = True
+
+        process = self._driver_service_process()
+        if process is not None and process.poll() is not None:
+            logger.warning("Webdriver's process has already exited. Skipping quit.")
+            return
+
+        def shut_down():
+            if self.page:
+                logger.debug("Trying to close webpage...")
+                self.close_webpage()
+                logger.debug("Webpage closed successfully.")
+            logger.debug("Trying to quit webdriver...")
+            self._quit_driver()
+            logger.info("Webdriver quit successfully.")
+
+        thread = threading.Thread(target=shut_down, daemon=True)
+        thread.start()
+        thread.join(_EXIT_TIMEOUT)
+        if not thread.is_alive():
+            return
+        service = getattr(self.driver, "service", None)
+        if process is not None and not service.is_connectable():
+            logger.warning(f"Webdriver didn't quit within {_EXIT_TIMEOUT} seconds and isn't responding. Killing it...")
+            process.kill()
+        else:
+            logger.warning(f"Webdriver didn't quit within {_EXIT_TIMEOUT} seconds. Leaving it to finish in the background.")
         return
 
+    def _driver_service_process(self) -> subprocess.Popen|None:
+        """
+        Get the driver's chromedriver process, if we started it.
+        """
+        return getattr(getattr(self.driver, "service", None), "process", None)
+
     @try_except
     def refresh_page(self) -> None:
         """
@@ -86,75 +379,133 @@ class SeleniumScraper:
 
     @get_exec_time
     @try_except(exception=[WebDriverException, InvalidArgumentException, TimeoutException], raise_exception=True)
-    def wait_to_fully_load(self, implicit_wait: int=5, page_load_timeout: int=10, class_name: str=None):
+    def wait_to_fully_load(self, implicit_wait: int=5, page_load_timeout: int=10, class_name: str=None, poll_frequency: float=0.1):
+        """
+        Wait for Angular to finish loading, the Table of Contents button to be on the page, and the document to be ready.
+
+        Args:
+            implicit_wait (int, optional): Unused. Defaults to 5.
+            page_load_timeout (int, optional): Maximum time to wait for the page, in seconds. Defaults to 10.
+            class_name (str): The class name of the Table of Contents button.
+            poll_frequency (float, optional): If the page can't be waited on over CDP, how often it re-checks Angular
+                between DOM changes, in seconds. Defaults to 0.1.
+
+        Raises:
+            TimeoutException: If the page isn't ready within page_load_timeout.
+        """
         assert class_name, "class_name must be provided."
-        logger.info("Waiting for page to full load...")
+        logger.debug("Waiting for page to full load...")
+
+        # Either way, the browser waits for the page itself and tells us when it's ready.
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self._wait_to_fully_load_cdp(page_load_timeout, class_name)
+        else:
+            self._ensure_script_timeout(page_load_timeout)
+            is_ready = self.driver.execute_async_script(
+                _WAIT_FOR_PAGE_READY_JS, class_name, int(page_load_timeout * 1000), int(poll_frequency * 1000)
+            )
+            if not is_ready:
+                raise TimeoutException(f"Page was not ready after {page_load_timeout} seconds.")
+        logger.info("Page fully loaded.")
+
+    def _wait_to_fully_load_cdp(self, page_load_timeout: int, class_name: str) -> None:
+        """
+        Wait for the page to be ready in a single CDP call, which resolves once the browser sees the page is ready.
 
-        # Wait for Angular to finish loading
-        angular_js_code = """
-        'return (window.angular !== undefined) && 
-        (angular.element(document).injector() !== undefined) && 
-        (angular.element(document).injector().get("$http").pendingRequests.length === 0)'
+        Raises:
+            TimeoutException: If the page isn't ready within page_load_timeout.
+            WebDriverException: If the ready check throws in the browser.
         """
-        WebDriverWait(self.driver, page_load_timeout).until(
-            lambda driver: driver.execute_script(angular_js_code)
-        )
-        logger.info("Angular finished loading.")
+        just_pinned = self.driver not in _PAGE_READY_SCRIPT_IDS
+        if just_pinned:
+            self._pin_page_ready_script()
 
-        # Wait for the Table of Contents button to be clickable
-        button = WebDriverWait(self.driver, page_load_timeout).until(
-            EC.presence_of_element_located((By.CLASS_NAME, class_name))
-        )
-        logger.info(f"toc_button found on page '{button.text}'.")
+        expression = f"window.__waitForPageReady({json.dumps(class_name)}, {page_load_timeout * 1000})"
+        params = {"expression": expression, "awaitPromise": True, "returnByValue": True}
+        result = self.driver.execute_cdp_cmd("Runtime.evaluate", params)
 
-        # Additional wait for any JavaScript to finish (adjust time as needed)
-        #self.driver.implicitly_wait(implicit_wait)
+        # Pinned scripts belong to the tab they were pinned in, so pin it again if we've switched tabs.
+        if "exceptionDetails" in result and not just_pinned:
+            self._pin_page_ready_script()
+            result = self.driver.execute_cdp_cmd("Runtime.evaluate", params)
+        if "exceptionDetails" in result:
+            raise WebDriverException(f"Page ready check failed: {result['exceptionDetails']}")
+        if not result["result"].get("value"):
+            raise TimeoutException(f"Page was not ready after {page_load_timeout} seconds.")
 
-        # Execute JavaScript to check if page is fully loaded
-        logger.info("Executing JavaScript command 'return document.readtState;'")
-        is_ready = self.driver.execute_script("return document.readyState;")
-        logger.info(f"JavaScript command successfully executed\nPage ready state: {is_ready}")
 
+    def _pin_page_ready_script(self) -> None:
+        """
+        Define the page ready check in the current document and every document loaded after it.
+        Any copy this driver pinned before is removed first, so copies don't pile up and run on every navigation.
+        """
+        old_identifier = _PAGE_READY_SCRIPT_IDS.pop(self.driver, None)
+        if old_identifier is not None:
+            try:
+                self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": old_identifier})
+            except WebDriverException:
+                # It was pinned in a tab we've since switched away from.
+                pass
+        result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _PAGE_READY_SCRIPT_JS})
+        self.driver.execute_cdp_cmd("Runtime.evaluate", {"expression": _PAGE_READY_SCRIPT_JS})
+        _PAGE_READY_SCRIPT_IDS[self.driver] = result["identifier"]
 
     @try_except(exception=[WebDriverException, InvalidArgumentException, TimeoutException])
-    def make_page(self, url: str) -> None:
+    def make_page(self, url: str, block_resources: bool=True) -> None:
         """
         Navigate to the specified URL using the given Chrome webdriver.
 
         Args:
             url (str): The URL to navigate to.
+            block_resources (bool, optional): Whether to skip downloading images, fonts, video, and analytics scripts
+                (see BLOCKED_URL_PATTERNS). Only works on Chromium drivers. Defaults to True.
         Raises:
             WebDriverException: If there's an issue with the WebDriver while navigating.
             TimeoutException: If the page load takes too long.
             InvalidArgumentException: If the URL is not valid.
             Exception: For any other unexpected errors making the page.
         """
+        if block_resources != self._blocking_resources and hasattr(self.driver, "execute_cdp_cmd"):
+            self._set_blocked_urls(BLOCKED_URL_PATTERNS if block_resources else ())
+            self._blocking_resources = block_resources
+
         logger.info(f"Getting URL {url}...")
         self.driver.get(url)
-        logger.info(f"URL ok.")
+        logger.debug("URL ok.")
+
 
+    def _set_blocked_urls(self, patterns: tuple[str, ...]) -> None:
+        """
+        Tell the browser not to download resources whose URLs match any of the given patterns.
+        """
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+    def _all_interactable_js(self, elements: list[WebElement]) -> bool:
+        """
+        Check if all the given elements are displayed and enabled, in a single call to the browser.
+        """
+        return bool(self.driver.execute_script(_ALL_INTERACTABLE_JS, elements))
 
     @try_except(exception=[WebDriverException, 
                            StaleElementReferenceException, 
                            TimeoutException])
-    def _check_if_interactable(self, xpath: str, wait_time: int, poll_frequency: float) -> None:
+    def _check_if_interactable(self, xpath: str, wait_time: int, poll_frequency: float=0.1) -> None:
         """
         Check if elements located by the given XPath are interactable (clickable).
 
         Args:
             xpath (str): The XPath used to locate the elements.
             wait_time (int): Maximum time to wait for the elements to become clickable, in seconds.
-            poll_frequency (float): How often to check if the elements are clickable, in seconds.
+            poll_frequency (float, optional): How often to check if the elements are clickable, in seconds. Defaults to 0.1.
 
         Raises:
             TimeoutException: If the elements are not clickable within the specified wait time.
             StaleElementReferenceException: If the element becomes stale during the wait.
             WebDriverException: For other WebDriver-related exceptions.
         """
-        WebDriverWait(self.driver,
-                    wait_time,
-                    poll_frequency=poll_frequency).until(
-            EC.element_to_be_clickable((By.XPATH, xpath))
+        self._wait(wait_time, poll_frequency).until(
+            lambda driver: (elements := driver.find_elements(*_locator(xpath))) and self._all_interactable_js(elements)
         )
         return
 
@@ -162,14 +513,14 @@ class SeleniumScraper:
                            StaleElementReferenceException, 
                            NoSuchElementException, 
                            TimeoutException])
-    def _wait_to_load(self, xpath: str, wait_time: int, poll_frequency: float) -> list[WebElement]:
+    def _wait_to_load(self, xpath: str, wait_time: int, poll_frequency: float=0.1) -> list[WebElement]:
         """
         Wait for elements specified by the given XPath to be present on the page.
 
         Args:
             xpath (str): The XPath used to locate the elements on the page.
             wait_time (int): Maximum time to wait for the elements to be present, in seconds.
-            poll_frequency (float): How often to check for the presence of the elements, in seconds.
+            poll_frequency (float, optional): How often to check for the presence of the elements, in seconds. Defaults to 0.1.
 
         Returns:
             list[WebElement]: A list of WebElements that match the provided XPath.
@@ -181,18 +532,40 @@ class SeleniumScraper:
             TimeoutException: If the wait time is exceeded before the elements are found.
         """
         # Wait for the element to load.
-        elements = WebDriverWait(self.driver,
-                                wait_time,
-                                poll_frequency=poll_frequency).until(
-            EC.presence_of_all_elements_located((By.XPATH, xpath))
+        elements = self._wait(wait_time, poll_frequency).until(
+            _lazy().EC.presence_of_all_elements_located(_locator(xpath))
         )
         return elements if elements else []
 
+    def _wait_present_and_clickable(self, xpath: str, wait_time: int, poll_frequency: float=0.1) -> list[WebElement]:
+        """
+        Wait for elements specified by the given XPath to be present on the page and enabled.
+        This is one wait, so the XPath is only resolved once per poll and the wait never exceeds wait_time.
+
+        Args:
+            xpath (str): The XPath used to locate the elements on the page.
+            wait_time (int): Maximum time to wait for the elements, in seconds.
+            poll_frequency (float, optional): How often to check the elements, in seconds. Defaults to 0.1.
+
+        Returns:
+            list[WebElement]: A list of WebElements that match the provided XPath.
+
+        Raises:
+            WebDriverException: If there's an issue with the WebDriver during the wait.
+            StaleElementReferenceException: If the element becomes stale during the wait.
+            TimeoutException: If the wait time is exceeded before the elements are present and enabled.
+        """
+        def present_and_clickable(driver: WebDriver) -> list[WebElement]|bool:
+            elements = driver.find_elements(*_locator(xpath))
+            return elements if elements and self._all_interactable_js(elements) else False
+
+        return self._wait(wait_time, poll_frequency).until(present_and_clickable)
+
 
     def wait_for_and_then_return_elements(self, 
                                          xpath: str, 
                                          wait_time: int = 10, 
-                                         poll_frequency: float = 0.5, 
+                                         poll_frequency: float = 0.1, 
                                          retries: int = 2
                                          ) -> list[WebElement]:
         """
@@ -201,34 +574,33 @@ class SeleniumScraper:
         Args:
             xpath (str): The XPath to locate the elements.
             wait_time (int, optional): Maximum time to wait for the elements, in seconds. Defaults to 10.
-            poll_frequency (float, optional): How often to check for the elements, in seconds. Defaults to 0.5.
+            poll_frequency (float, optional): How often to check for the elements, in seconds. Defaults to 0.1.
 
         Returns:
             list[WebElement]: A list of WebElements that match the XPath and are interactable. 
+                Empty if they aren't found or interactable within the wait time, or keep going stale after every retry.
 
         Raises:
-            TimeoutException: If the elements are not found or not interactable within the specified wait time.
-            StaleElementReferenceException: If the element becomes stale during the wait. The method will retry in this case.
-            NoSuchElementException: If no elements are found matching the XPath.
-            Exception: For any other unexpected errors during the wait process.
+            WebDriverException: For any other WebDriver errors during the wait.
         """
         assert retries > 0
-        counter = 0
-        while counter < retries:
+        for _ in range(retries):
             try:
-                # Wait for the element to load.
-                elements = self._wait_to_load(xpath, wait_time, poll_frequency)
+                # Wait for the elements to load and become interactable.
+                elements = self._wait_present_and_clickable(xpath, wait_time, poll_frequency)
                 if not elements:
                     logger.warning(f"No elements found for x-path '{xpath}'.\nReturning empty list...")
                     return []
-
-                # Check to see if the element is interactable.
-                self._check_if_interactable(xpath, wait_time, poll_frequency)
-
                 return elements
-            except:
-                counter += 1
-        logger.exception(f"Could not locate elements after {counter + 1} retries.\nReturning empty list...")
+            except StaleElementReferenceException as e:
+                # The page changed under us, so it's worth another look.
+                logger.debug(f"Retrying x-path '{xpath}' after {type(e).__qualname__}: {e}")
+                continue
+            except (TimeoutException, NoSuchElementException):
+                # Waiting again won't make missing elements appear.
+                logger.warning(f"Elements for x-path '{xpath}' not found within {wait_time} seconds.\nReturning empty list...")
+                return []
+        logger.error(f"Elements for x-path '{xpath}' went stale on all {retries} tries.\nReturning empty list...")
         return []
 
 
@@ -253,32 +625,76 @@ class SeleniumScraper:
                 - If first_elem is False: Returns a list of matching WebElements, or None if none found.
 
         Raises:
-            NoSuchElementException: If no elements are found and first_elem is True.
-            WebDriverException: For other Selenium-related errors.
+            WebDriverException: For Selenium-related errors.
         """
-        logger.info(f"Searching for {'first element' if first_elem else 'all elements'} along x-path '{xpath}'")
-        elements: WebElement = self.driver.find_element(by=By.XPATH, value=xpath)
+        logger.debug(f"Searching for {'first element' if first_elem else 'all elements'} along x-path '{xpath}'")
+        elements = self.driver.find_elements(*_locator(xpath))
         if not elements:
             logger.warning(f"No elements found for URL '{url}'.\n Check the x-path '{xpath}'.\nReturning None...")
             return None
-
-        elements = elements if first_elem else self.driver.find_elements(by=By.XPATH, value=xpath)
-        return elements
+        return elements[0] if first_elem else elements
 
     def wait_for_aria_expanded(self, element: WebElement, state: bool='true', timeout: int=10):
         """
         Wait for an element's 'aria-expanded' attribute to become 'true' or 'false'.
         """
-        WebDriverWait(self.driver, timeout).until(
+        self._wait(timeout).until(
             lambda driver: element.get_attribute('aria-expanded') == state
         )
 
+    def _ensure_script_timeout(self, timeout: float) -> None:
+        """
+        Make sure the driver doesn't give up on an async script before it times out on its own.
+        """
+        if timeout >= self._script_timeout:
+            self._script_timeout = timeout + 1
+            self.driver.set_script_timeout(self._script_timeout)
+
+    def wait_for_selector(self, selector: str, timeout: float=10, min_count: int=0) -> bool:
+        """
+        Wait for more than min_count elements matching a CSS selector to be on the page.
+        The browser reports when it's rendered, so this is a single call to it rather than a polling loop.
+
+        Args:
+            selector (str): The CSS selector to wait for.
+            timeout (float, optional): Maximum time to wait, in seconds. Defaults to 10.
+            min_count (int, optional): How many matches there were before, to wait for a new one. 
+                Defaults to 0, i.e. any match.
+
+        Returns:
+            bool: True if enough matching elements are on the page, False if the wait timed out.
+        """
+        self._ensure_script_timeout(timeout)
+        return bool(self.driver.execute_async_script(_WAIT_FOR_SELECTOR_JS, selector, min_count, int(timeout * 1000)))
+
+    @staticmethod
+    def _default_post_click_condition(button: WebElement) -> Callable[[WebDriver, WebElement], bool]|None:
+        """
+        Make a condition that's met once a button has reacted to being clicked.
+        Must be called before the click.
+
+        If the button has an 'aria-expanded' attribute, the condition is met once it flips.
+        Otherwise, there's nothing to wait on, so it returns None.
+        """
+        before = button.get_attribute('aria-expanded')
+        if before is None:
+            return None
+
+        def aria_expanded_flipped(driver: WebDriver, button: WebElement) -> bool:
+            try:
+                return button.get_attribute('aria-expanded') != before
+            except StaleElementReferenceException:
+                return True
+        return aria_expanded_flipped
+
     @try_except(exception=[WebDriverException])
     def press_buttons(self, 
                       xpath: str, 
                       first_button: bool = True, 
                       delay: float = 0.5,
                       target_buttons: list[str] = None,
+                      post_click_condition: Callable[[WebDriver, WebElement], bool] = None,
+                      wait_for_selector: str = None,
                       ) -> None:
         """
         Press one or multiple buttons identified by the given XPath.
@@ -289,29 +705,158 @@ class SeleniumScraper:
             first_button (bool, optional): If True, only the first button found will be clicked.
                                            If False, all matching buttons will be clicked. 
                                            Defaults to True.
-            delay (float, optional): Wait between button clicks. Defaults to 0.5 (half a second)
+            delay (float, optional): Longest wait for a button to react to a click before clicking the next one.
+                Defaults to 0.5 (half a second)
             targt_buttons(list[str], optional): A list specifying which buttons to press if they are found. Defaults to None.
+            post_click_condition (Callable[[WebDriver, WebElement], bool], optional): Takes the driver and the clicked button,
+                and returns True once the page has reacted to the click. 
+                Defaults to waiting for the button's 'aria-expanded' attribute to flip, or a fixed 0.05 seconds if it doesn't have one.
+            wait_for_selector (str, optional): A CSS selector for the content each click renders. 
+                If given, waits for a new match to appear instead of checking post_click_condition. Defaults to None.
 
         Raises:
             WebDriverException: If there's an issue with the WebDriver while attempting to click.
         """
         # Find all the buttons
-        buttons = self.driver.find_elements(By.XPATH, xpath)
+        buttons = self.driver.find_elements(*_locator(xpath))
         if not buttons:
             logger.warning(f"No buttons found for XPath: {xpath}")
             return
 
         # Click on all or a specified set of buttons.
         buttons_to_click = buttons[:1] if first_button else buttons
+        if target_buttons:
+            buttons_to_click = self.driver.execute_script(_FILTER_BY_TEXT_JS, buttons_to_click, list(target_buttons))
         for button in buttons_to_click:
-            if target_buttons:
-                if button.text in target_buttons:
-                    button.click()
-            else:
+            if wait_for_selector:
+                # Earlier clicks may have rendered matches already, so wait for one more than there are now.
+                count = self.driver.execute_script(_COUNT_SELECTOR_JS, wait_for_selector)
                 button.click()
-            time.sleep(delay)  # Wait between clicks
+                self.wait_for_selector(wait_for_selector, timeout=delay, min_count=count)
+                continue
+
+            condition = post_click_condition or self._default_post_click_condition(button)
+            button.click()
+            if condition is None:
+                time.sleep(_NO_CONDITION_CLICK_DELAY)
+                continue
+
+            # Wait for the page to react to the click, rather than a fixed delay.
+            try:
+                # Poll every 50 ms without backing off, since buttons usually react quickly.
+                self._wait(delay, 0.1, max_poll=0.05).until(
+                    lambda driver: condition(driver, button)
+                )
+            except TimeoutException:
+                pass
+        return
+
+class SeleniumScraperPool:
+    """
+    A pool of Chrome drivers that scrape a list of URLs in parallel, one worker thread per driver.
+    Starting a driver takes a second or two, so the drivers are kept for every URL instead of one per URL.
+
+    Parameters:
+        make_driver (Callable[[], webdriver.Chrome]): Makes a new Chrome driver.
+        max_drivers (int, optional): The most drivers to start. 
+            The pool starts min(cpu_count(), max_drivers) drivers, since each is its own Chrome process. Defaults to 4.
+        wait_in_seconds (int, optional): Passed on to each SeleniumScraper. Defaults to 1.
+
+    Attributes:
+        idle_scrapers (queue.Queue[SeleniumScraper]): Scrapers, one per driver, that aren't scraping a URL right now.
+        work (queue.Queue[tuple[int, str]]): URLs waiting to be scraped, with their index in the list given to map.
+    """
+
+    def __init__(self,
+                 make_driver: Callable[[], webdriver.Chrome],
+                 max_drivers: int=4,
+                 wait_in_seconds: int=1):
+        self.size: int = max(1, min(os.cpu_count() or 1, max_drivers))
+        self.wait_in_seconds = wait_in_seconds
+        self.idle_scrapers: queue.Queue[SeleniumScraper] = queue.Queue()
+        self.work: queue.Queue[tuple[int, str]] = queue.Queue()
+        self._scrapers: list[SeleniumScraper] = []
+
+        # Start the drivers in parallel.
+        logger.info(f"Starting {self.size} Chrome drivers...")
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(make_driver) for _ in range(self.size)]
+        # Leaving the executor waited for every driver to start or fail.
+        drivers = [future.result() for future in futures if future.exception() is None]
+        # One scraper per driver, kept for every URL, so its cached waits and settings carry over.
+        self._scrapers = [SeleniumScraper(driver, self.wait_in_seconds) for driver in drivers]
+        # If any driver failed to start, quit the ones that did rather than leaking their Chrome processes.
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            logger.error(f"{len(errors)} of {self.size} Chrome drivers failed to start. Quitting the rest...")
+            self.exit()
+            raise errors[0]
+        for scraper in self._scrapers:
+            self.idle_scrapers.put(scraper)
+
+    def __enter__(self) -> 'SeleniumScraperPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.exit()
+        return False
+
+    def exit(self) -> None:
+        """
+        Quit every driver in the pool.
+        The drivers quit in parallel, and each SeleniumScraper.exit gives up after _EXIT_TIMEOUT seconds,
+        so shutting down the pool takes about that long at most, however many drivers it has.
+        """
+        if self._scrapers:
+            with ThreadPoolExecutor(max_workers=len(self._scrapers)) as executor:
+                list(executor.map(lambda scraper: scraper.exit(), self._scrapers))
+        self._scrapers = []
         return
 
+    def _worker(self, scrape_one: Callable[[SeleniumScraper, str], Any], results: list) -> None:
+        """
+        Take URLs off the work queue and scrape them with the next idle scraper, until there are no URLs left.
+        """
+        while True:
+            try:
+                idx, url = self.work.get_nowait()
+            except queue.Empty:
+                return
+            scraper = self.idle_scrapers.get()
+            try:
+                scraper.make_page(url)
+                results[idx] = scrape_one(scraper, url)
+            except Exception as e:
+                logger.exception(f"{type(e).__qualname__} while scraping '{url}': {e}")
+            finally:
+                self.idle_scrapers.put(scraper)
+
+    def map(self, urls: list[str], scrape_one: Callable[[SeleniumScraper, str], Any]) -> list[Any]:
+        """
+        Scrape a list of URLs in parallel.
+
+        Args:
+            urls (list[str]): The URLs to scrape.
+            scrape_one (Callable[[SeleniumScraper, str], Any]): Scrapes a URL once its page has been made, 
+                e.g. by calling wait_to_fully_load and then press_buttons. It shouldn't quit the driver.
+
+        Returns:
+            list[Any]: What scrape_one returned for each URL, in the same order as urls. None for any URL that failed.
+        """
+        results = [None] * len(urls)
+        for idx, url in enumerate(urls):
+            self.work.put((idx, url))
+
+        threads = [
+            threading.Thread(target=self._worker, args=(scrape_one, results), daemon=True)
+            for _ in range(min(self.size, len(urls)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
 
 
 
@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("protego")
+
+from web_scraper.playwright.async_.utils.robots_txt_parser import RobotsTxtParser
+
+
+def _parse(robots_txt: str) -> RobotsTxtParser:
+    rp = RobotsTxtParser("https://example.com/robots.txt")
+    rp.parse(robots_txt.splitlines())
+    return rp
+
+
+def test_grouped_user_agent_lines_share_rules():
+    rp = _parse(
+        "User-agent: first-bot\n"
+        "User-agent: second-bot\n"
+        "Disallow: /private\n"
+    )
+    assert not rp.can_fetch("first-bot", "https://example.com/private/page")
+    assert not rp.can_fetch("second-bot", "https://example.com/private/page")
+    assert rp.can_fetch("other-bot", "https://example.com/private/page")
+
+
+def test_comments_after_directives_are_ignored():
+    rp = _parse(
+        "User-agent: * # everyone\n"
+        "Disallow: /secret # keep out\n"
+    )
+    assert not rp.can_fetch("any-bot", "https://example.com/secret")
+    assert rp.can_fetch("any-bot", "https://example.com/public")
+
+
+def test_fractional_crawl_delay_is_kept():
+    rp = _parse(
+        "User-agent: *\n"
+        "Crawl-delay: 0.5\n"
+    )
+    assert rp.crawl_delay("any-bot") == 0.5
+
+
+def test_nothing_can_be_fetched_before_parsing():
+    rp = RobotsTxtParser("https://example.com/robots.txt")
+    assert not rp.can_fetch("any-bot", "https://example.com/")
+    assert rp.crawl_delay("any-bot") is None